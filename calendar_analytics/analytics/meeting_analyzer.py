@@ -133,22 +133,19 @@ class MeetingAnalyzer:
         - Medium: 31-60 minutes
         - Long: >60 minutes
         """
-        matrix = SizeDurationMatrix()
-
+        # Tally per (size, duration) cell in local dicts, then name and set
+        # each matrix field once rather than formatting a key per event
+        counts: dict[tuple[str, str], int] = defaultdict(int)
+        hours: dict[tuple[str, str], float] = defaultdict(float)
         for event in events:
-            size = event.get_size_category()
-            duration = event.get_duration_category()
-            hours = event.duration_hours
-
-            # Update counts and hours
-            attr_count = f"{size}_{duration}"
-            attr_hours = f"{size}_{duration}_hours"
+            cell = (event.get_size_category(), event.get_duration_category())
+            counts[cell] += 1
+            hours[cell] += event.duration_hours
 
-            current_count = getattr(matrix, attr_count, 0)
-            current_hours = getattr(matrix, attr_hours, 0.0)
-
-            setattr(matrix, attr_count, current_count + 1)
-            setattr(matrix, attr_hours, current_hours + hours)
+        matrix = SizeDurationMatrix()
+        for (size, duration), count in counts.items():
+            setattr(matrix, f"{size}_{duration}", count)
+            setattr(matrix, f"{size}_{duration}_hours", hours[size, duration])
 
         return matrix
 
@@ -301,52 +298,56 @@ class MeetingAnalyzer:
         - Distribution by hour of day
         - Early/late meeting patterns
         """
-        by_day: dict[str, list] = defaultdict(list)
-        by_hour: dict[int, list] = defaultdict(list)
+        # One pass accumulates counts and hours per day and per start hour
+        day_counts: dict[str, int] = defaultdict(int)
+        day_hours: dict[str, float] = {}
+        hour_counts = [0] * 24
+        hour_hours = [0] * 24
 
         for event in events:
-            by_day[event.day_of_week].append(event)
-            by_hour[event.hour_of_day].append(event)
+            hours = event.duration_hours
+            day = event.day_of_week
+            hour = event.hour_of_day
+            day_counts[day] += 1
+            day_hours[day] = day_hours.get(day, 0) + hours
+            hour_counts[hour] += 1
+            hour_hours[hour] += hours
 
         # Day of week analysis
         day_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
         day_stats = {}
 
         for day in day_order:
-            day_events = by_day.get(day, [])
             day_stats[day] = {
-                "count": len(day_events),
-                "hours": round(sum(e.duration_hours for e in day_events), 2),
+                "count": day_counts.get(day, 0),
+                "hours": round(day_hours.get(day, 0), 2),
             }
 
         # Hour of day analysis
         hour_stats = {}
         for hour in range(24):
-            hour_events = by_hour.get(hour, [])
             hour_stats[f"{hour:02d}:00"] = {
-                "count": len(hour_events),
-                "hours": round(sum(e.duration_hours for e in hour_events), 2),
+                "count": hour_counts[hour],
+                "hours": round(hour_hours[hour], 2),
             }
 
-        # Special timing patterns
-        early_meetings = [e for e in events if e.is_early_morning]
-        late_meetings = [e for e in events if e.is_late_evening]
-        lunch_meetings = [e for e in events if e.is_lunch_time]
-
+        # Special timing patterns, read off the hour buckets using the same
+        # bands as is_early_morning (<9), is_late_evening (>=18) and
+        # is_lunch_time (12)
         return {
             "by_day_of_week": day_stats,
             "by_hour": hour_stats,
             "early_morning_meetings": {
-                "count": len(early_meetings),
-                "hours": round(sum(e.duration_hours for e in early_meetings), 2),
+                "count": sum(hour_counts[:9]),
+                "hours": round(sum(hour_hours[:9]), 2),
             },
             "late_evening_meetings": {
-                "count": len(late_meetings),
-                "hours": round(sum(e.duration_hours for e in late_meetings), 2),
+                "count": sum(hour_counts[18:]),
+                "hours": round(sum(hour_hours[18:]), 2),
             },
             "lunch_time_meetings": {
-                "count": len(lunch_meetings),
-                "hours": round(sum(e.duration_hours for e in lunch_meetings), 2),
+                "count": hour_counts[12],
+                "hours": round(hour_hours[12], 2),
             },
             "busiest_day": max(day_stats.keys(), key=lambda d: day_stats[d]["hours"]) if day_stats else None,
             "busiest_hour": max(hour_stats.keys(), key=lambda h: hour_stats[h]["count"]) if hour_stats else None,
@@ -8,7 +8,7 @@ from typing import Optional
 from ..models.calendar_event import CalendarEvent, MeetingCategory
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicCluster:
     """Represents a cluster of related meeting topics."""
     name: str
@@ -51,6 +51,11 @@ class MeetingTextAnalyzer:
         "call", "sync", "chat", "discussion", "follow", "quick", "brief",
     }
 
+    # Action verbs that mark a meeting name as descriptive
+    ACTION_WORDS = (
+        "review", "discuss", "plan", "decide", "present", "analyze", "define", "create", "design",
+    )
+
     # Topic patterns for clustering
     TOPIC_PATTERNS = {
         "product_planning": {
@@ -124,34 +129,36 @@ class MeetingTextAnalyzer:
         self.topic_clusters = self._initialize_clusters()
 
         # Classify each meeting
-        classified = []
-        unclassified = []
+        classified_count = 0
+        unclassified_count = 0
+        unclassified_samples = []
 
         for event in events:
-            text = f"{event.subject} {event.body}".lower()
-            matched_topics = []
+            # Read once per event rather than once per matching topic
+            subject = event.subject
+            hours = event.duration_hours
+            text = f"{subject} {event.body}".lower()
+            matched = False
 
             for topic_name, config in self.TOPIC_PATTERNS.items():
                 if re.search(config["pattern"], text):
-                    matched_topics.append(topic_name)
+                    matched = True
                     cluster = self.topic_clusters[topic_name]
                     cluster.meeting_count += 1
-                    cluster.total_hours += event.duration_hours
+                    cluster.total_hours += hours
                     if len(cluster.sample_subjects) < 10:
-                        cluster.sample_subjects.append(event.subject)
+                        cluster.sample_subjects.append(subject)
 
-            if matched_topics:
-                classified.append({
-                    "subject": event.subject,
-                    "topics": matched_topics,
-                    "duration": event.duration_minutes,
-                })
+            if matched:
+                classified_count += 1
             else:
-                unclassified.append(event.subject)
+                unclassified_count += 1
+                if len(unclassified_samples) < 10:
+                    unclassified_samples.append(subject)
 
         # Calculate statistics
         total_events = len(events)
-        classification_rate = len(classified) / total_events if total_events > 0 else 0
+        classification_rate = classified_count / total_events if total_events > 0 else 0
 
         # Sort clusters by meeting count
         sorted_clusters = sorted(
@@ -163,9 +170,9 @@ class MeetingTextAnalyzer:
         return {
             "topic_clusters": [c.to_dict() for c in sorted_clusters if c.meeting_count > 0],
             "classification_rate": round(classification_rate * 100, 1),
-            "total_classified": len(classified),
-            "total_unclassified": len(unclassified),
-            "unclassified_samples": unclassified[:10],
+            "total_classified": classified_count,
+            "total_unclassified": unclassified_count,
+            "unclassified_samples": unclassified_samples,
         }
 
     def extract_keywords(
@@ -237,22 +244,28 @@ class MeetingTextAnalyzer:
         Returns:
             Category breakdown with statistics
         """
+        # Seeded on first appearance, so categories with equal counts keep
+        # that order through the stable sort below
         category_stats: dict[MeetingCategory, dict] = defaultdict(
-            lambda: {"count": 0, "hours": 0, "subjects": []}
+            lambda: {"count": 0, "hours": 0.0, "subjects": []}
         )
 
+        total_hours = 0.0
+
         for event in events:
             category = event.classify_meeting_category()
-            category_stats[category]["count"] += 1
-            category_stats[category]["hours"] += event.duration_hours
+            hours = event.duration_hours
+            stats = category_stats[category]
+            stats["count"] += 1
+            stats["hours"] += hours
+            total_hours += hours
 
-            if len(category_stats[category]["subjects"]) < 5:
-                category_stats[category]["subjects"].append(event.subject)
+            if len(stats["subjects"]) < 5:
+                stats["subjects"].append(event.subject)
 
         # Convert to output format
         results = {}
         total_events = len(events)
-        total_hours = sum(e.duration_hours for e in events)
 
         for category, stats in category_stats.items():
             results[category.value] = {
@@ -326,11 +339,11 @@ class MeetingTextAnalyzer:
             # Check for vague names
             if re.match(r'^(meeting|call|sync|chat|catch up|check in|touchbase|touch base)$', subject.strip()):
                 patterns["is_vague"] += 1
-                vague_subjects.append(event.subject)
+                if len(vague_subjects) < 10:
+                    vague_subjects.append(event.subject)
 
             # Check for descriptive names (contains action words)
-            action_words = ["review", "discuss", "plan", "decide", "present", "analyze", "define", "create", "design"]
-            if any(word in subject for word in action_words):
+            if any(word in subject for word in self.ACTION_WORDS):
                 patterns["is_descriptive"] += 1
                 if len(well_named) < 10:
                     well_named.append(event.subject)
@@ -359,15 +372,18 @@ class MeetingTextAnalyzer:
 
             quality_score = max(0, min(100, quality_score + 50))  # Normalize to 0-100
 
+        # One scale factor instead of a division per pattern
+        scale = 100 / total if total else 0
+
         return {
-            "pattern_counts": {k: v for k, v in patterns.items()},
+            "pattern_counts": dict(patterns),
             "pattern_percentages": {
-                k: round(v / total * 100, 1) if total else 0
+                k: round(v * scale, 1)
                 for k, v in patterns.items()
             },
             "naming_quality_score": round(quality_score, 1),
             "vague_meeting_count": patterns["is_vague"],
-            "vague_meeting_samples": vague_subjects[:10],
+            "vague_meeting_samples": vague_subjects,
             "well_named_samples": well_named,
             "recommendations": self._get_naming_recommendations(patterns, total),
         }
@@ -426,59 +442,47 @@ class MeetingTextAnalyzer:
             r'\bincident\b', r'\boutage\b', r'\bescalat', r'\bbug\b',
         ]
 
-        results = {
+        sentiment_patterns = [
+            ("urgent", urgent_patterns),
+            ("positive", positive_patterns),
+            ("potentially_negative", potentially_negative),
+        ]
+
+        # Counts are unbounded; only the first few samples are kept
+        counts = {"urgent": 0, "positive": 0, "potentially_negative": 0, "neutral": 0}
+        samples: dict[str, list[dict]] = {
             "urgent": [],
             "positive": [],
             "potentially_negative": [],
-            "neutral": [],
         }
 
         for event in events:
             subject_lower = event.subject.lower()
-            categorized = False
-
-            for pattern in urgent_patterns:
-                if re.search(pattern, subject_lower):
-                    results["urgent"].append({
-                        "subject": event.subject,
-                        "date": event.start_time.isoformat(),
-                    })
-                    categorized = True
+            sentiment = "neutral"
+
+            for label, label_patterns in sentiment_patterns:
+                if any(re.search(pattern, subject_lower) for pattern in label_patterns):
+                    sentiment = label
                     break
 
-            if not categorized:
-                for pattern in positive_patterns:
-                    if re.search(pattern, subject_lower):
-                        results["positive"].append({
-                            "subject": event.subject,
-                            "date": event.start_time.isoformat(),
-                        })
-                        categorized = True
-                        break
-
-            if not categorized:
-                for pattern in potentially_negative:
-                    if re.search(pattern, subject_lower):
-                        results["potentially_negative"].append({
-                            "subject": event.subject,
-                            "date": event.start_time.isoformat(),
-                        })
-                        categorized = True
-                        break
-
-            if not categorized:
-                results["neutral"].append(event.subject)
+            counts[sentiment] += 1
+
+            if sentiment != "neutral" and len(samples[sentiment]) < 10:
+                samples[sentiment].append({
+                    "subject": event.subject,
+                    "date": event.start_time.isoformat(),
+                })
 
         return {
             "summary": {
-                "urgent_count": len(results["urgent"]),
-                "positive_count": len(results["positive"]),
-                "potentially_negative_count": len(results["potentially_negative"]),
-                "neutral_count": len(results["neutral"]),
+                "urgent_count": counts["urgent"],
+                "positive_count": counts["positive"],
+                "potentially_negative_count": counts["potentially_negative"],
+                "neutral_count": counts["neutral"],
             },
-            "urgent_meetings": results["urgent"][:10],
-            "positive_meetings": results["positive"][:10],
-            "potentially_negative_meetings": results["potentially_negative"][:10],
+            "urgent_meetings": samples["urgent"],
+            "positive_meetings": samples["positive"],
+            "potentially_negative_meetings": samples["potentially_negative"],
         }
 
     def get_comprehensive_text_analysis(
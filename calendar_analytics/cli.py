@@ -21,7 +21,7 @@ Examples:
   calendar-analytics analyze --hris ./hris_data.json --calendars ./calendars/ --output ./report.md
 
   # Generate individual report
-  calendar-analytics individual --email john.doe@example.com --output ./john_report.md
+  calendar-analytics individual --email john.doe@example.com --output ./john_report.json
 
   # Run demo with sample data
   calendar-analytics demo
@@ -30,49 +30,59 @@ Examples:
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Generate sample data command
-    gen_parser = subparsers.add_parser("generate-sample", help="Generate sample data for testing")
+    # Only the selected command gets its full argument set; the others are
+    # registered by name so they still appear in --help.
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+
+    for name, (help_text, add_arguments, _) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if name == command:
+            add_arguments(command_parser)
+
+    args = parser.parse_args()
+
+    if args.command in COMMANDS:
+        _, _, run = COMMANDS[args.command]
+        run(args)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+def _add_generate_sample_arguments(gen_parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the generate-sample command."""
     gen_parser.add_argument("--employees", type=int, default=50, help="Number of employees (default: 50)")
     gen_parser.add_argument("--days", type=int, default=30, help="Number of days of data (default: 30)")
     gen_parser.add_argument("--output", "-o", type=str, default="./sample_data", help="Output directory")
     gen_parser.add_argument("--seed", type=int, help="Random seed for reproducibility")
     gen_parser.add_argument("--domain", type=str, default="example.com", help="Company email domain")
 
-    # Analyze command
-    analyze_parser = subparsers.add_parser("analyze", help="Run full calendar analysis")
-    analyze_parser.add_argument("--hris", "-h", type=str, required=True, help="Path to HRIS data file (JSON/CSV)")
+
+def _add_analyze_arguments(analyze_parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the analyze command."""
+    analyze_parser.add_argument("--hris", type=str, required=True, help="Path to HRIS data file (JSON/CSV)")
     analyze_parser.add_argument("--calendars", "-c", type=str, required=True, help="Path to calendars directory or file")
     analyze_parser.add_argument("--output", "-o", type=str, default="./report.md", help="Output report path")
     analyze_parser.add_argument("--format", type=str, choices=["markdown", "html", "json", "text"], default="markdown")
     analyze_parser.add_argument("--domain", type=str, help="Company email domain (auto-detected if not provided)")
 
-    # Individual analysis command
-    ind_parser = subparsers.add_parser("individual", help="Generate individual report")
+
+def _add_individual_arguments(ind_parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the individual command."""
     ind_parser.add_argument("--email", "-e", type=str, required=True, help="Employee email to analyze")
     ind_parser.add_argument("--hris", type=str, required=True, help="Path to HRIS data file")
     ind_parser.add_argument("--calendars", type=str, required=True, help="Path to calendars directory")
     ind_parser.add_argument("--output", "-o", type=str, help="Output report path")
-    ind_parser.add_argument("--format", type=str, choices=["markdown", "html", "json"], default="markdown")
+    # The report layouts expect organization-wide insights, so individual
+    # insights are only written as JSON
+    ind_parser.add_argument("--format", type=str, choices=["json"], default="json")
 
-    # Demo command
-    demo_parser = subparsers.add_parser("demo", help="Run demo with generated sample data")
+
+def _add_demo_arguments(demo_parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the demo command."""
     demo_parser.add_argument("--employees", type=int, default=30, help="Number of employees")
     demo_parser.add_argument("--days", type=int, default=14, help="Number of days")
 
-    args = parser.parse_args()
-
-    if args.command == "generate-sample":
-        run_generate_sample(args)
-    elif args.command == "analyze":
-        run_analyze(args)
-    elif args.command == "individual":
-        run_individual(args)
-    elif args.command == "demo":
-        run_demo(args)
-    else:
-        parser.print_help()
-        sys.exit(1)
-
 
 def run_generate_sample(args):
     """Generate sample data."""
@@ -110,12 +120,16 @@ def run_generate_sample(args):
     print(f"\nSample data saved to: {args.output}")
 
 
+# Maps the remaining underscores of a calendar file stem back to dots
+_STEM_TO_EMAIL = str.maketrans("_", ".")
+
+
 def run_analyze(args):
     """Run full calendar analysis."""
     from .data_loaders.hris_loader import HRISLoader
     from .data_loaders.outlook_loader import OutlookCalendarLoader
     from .analytics.insights_engine import InsightsEngine
-    from .utils.report_generator import ReportGenerator
+    from .utils.report_generator import ReportGenerator, format_metric
 
     print("Loading data...")
 
@@ -133,43 +147,58 @@ def run_analyze(args):
     # Determine domain
     domain = args.domain or org.domain
     if not domain and org.employees:
-        first_email = list(org.employees.keys())[0]
+        first_email = next(iter(org.employees))
         domain = first_email.split("@")[1] if "@" in first_email else ""
 
     # Load calendar data
     calendar_loader = OutlookCalendarLoader(company_domain=domain)
     calendars_path = Path(args.calendars)
 
-    all_events = []
-
     if calendars_path.is_dir():
         # Load all calendar files in directory
-        for cal_file in calendars_path.glob("*.json"):
-            email = cal_file.stem.replace("_at_", "@").replace("_", ".")
-            events = calendar_loader.load_json(cal_file, email)
-            all_events.extend(events)
-
-        for cal_file in calendars_path.glob("*.csv"):
-            email = cal_file.stem.replace("_at_", "@").replace("_", ".")
-            events = calendar_loader.load_csv(cal_file, email)
-            all_events.extend(events)
+        calendar_files = [
+            *calendars_path.glob("*.json"), *calendars_path.glob("*.csv")
+        ]
+        owner_emails = [
+            f.stem.replace("_at_", "@").translate(_STEM_TO_EMAIL) for f in calendar_files
+        ]
     else:
         # Single file
-        if calendars_path.suffix == ".json":
-            all_events = calendar_loader.load_json(calendars_path)
+        calendar_files = [calendars_path]
+        owner_emails = [""]
+
+    # Deduplicate while loading (same event may appear in multiple calendars),
+    # so duplicates are dropped file by file instead of held until the end
+    seen = set()
+    events = []
+    total_loaded = 0
+
+    # Calendars exported with shared_events hold event IDs, with the events
+    # themselves in events.jsonl next to the calendars directory
+    events_path = calendars_path.parent / "events.jsonl"
+    shared_calendars = {}
+    if calendars_path.is_dir() and events_path.exists():
+        shared_calendars = calendar_loader.load_shared_calendars(
+            events_path,
+            {email: f for f, email in zip(calendar_files, owner_emails) if f.suffix == ".json"}
+        )
+
+    for cal_file, owner_email in zip(calendar_files, owner_emails):
+        if owner_email in shared_calendars:
+            file_events = shared_calendars[owner_email]
+        elif cal_file.suffix == ".json":
+            file_events = calendar_loader.load_json(cal_file, owner_email)
         else:
-            all_events = calendar_loader.load_csv(calendars_path)
+            file_events = calendar_loader.load_csv(cal_file, owner_email)
 
-    print(f"  Loaded {len(all_events)} calendar events")
-
-    # Deduplicate events (same event may appear in multiple calendars)
-    unique_events = {}
-    for event in all_events:
-        key = f"{event.subject}_{event.start_time}_{event.organizer_email}"
-        if key not in unique_events:
-            unique_events[key] = event
+        total_loaded += len(file_events)
+        for event in file_events:
+            key = (event.subject, event.start_time, event.organizer_email)
+            if key not in seen:
+                seen.add(key)
+                events.append(event)
 
-    events = list(unique_events.values())
+    print(f"  Loaded {total_loaded} calendar events")
     print(f"  {len(events)} unique events after deduplication")
 
     # Run analysis
@@ -188,8 +217,8 @@ def run_analyze(args):
     print("ANALYSIS COMPLETE")
     print("=" * 50)
     print(f"Total Meetings: {summary.get('total_meetings', 'N/A')}")
-    print(f"Total Hours: {summary.get('total_hours', 'N/A'):.1f}")
-    print(f"Avg per Day: {summary.get('avg_meetings_per_day', 'N/A'):.1f} meetings, {summary.get('avg_hours_per_day', 'N/A'):.1f} hours")
+    print(f"Total Hours: {format_metric(summary.get('total_hours', 'N/A'))}")
+    print(f"Avg per Day: {format_metric(summary.get('avg_meetings_per_day', 'N/A'))} meetings, {format_metric(summary.get('avg_hours_per_day', 'N/A'))} hours")
     print(f"\nReport saved to: {args.output}")
 
 
@@ -198,7 +227,6 @@ def run_individual(args):
     from .data_loaders.hris_loader import HRISLoader
     from .data_loaders.outlook_loader import OutlookCalendarLoader
     from .analytics.insights_engine import InsightsEngine
-    from .utils.report_generator import ReportGenerator
 
     print(f"Analyzing calendar for: {args.email}")
 
@@ -232,10 +260,7 @@ def run_individual(args):
     output_path = args.output or f"./report_{args.email.replace('@', '_')}.{args.format}"
 
     with open(output_path, "w") as f:
-        if args.format == "json":
-            json.dump(insights, f, indent=2, default=str)
-        else:
-            f.write(json.dumps(insights, indent=2, default=str))
+        json.dump(insights, f, indent=2, default=str)
 
     print(f"Individual report saved to: {output_path}")
 
@@ -266,13 +291,14 @@ def run_demo(args):
         all_events.extend(events)
 
     # Deduplicate
-    unique_events = {}
+    seen = set()
+    events = []
     for event in all_events:
-        key = f"{event.event_id}"
-        if key not in unique_events:
-            unique_events[key] = event
+        key = event.event_id
+        if key not in seen:
+            seen.add(key)
+            events.append(event)
 
-    events = list(unique_events.values())
     print(f"  ✓ Generated {len(events)} unique meetings")
 
     print("\nRunning analysis...")
@@ -324,5 +350,14 @@ def run_demo(args):
     print("=" * 60)
 
 
+# Command name -> (help text, argument builder, handler)
+COMMANDS = {
+    "generate-sample": ("Generate sample data for testing", _add_generate_sample_arguments, run_generate_sample),
+    "analyze": ("Run full calendar analysis", _add_analyze_arguments, run_analyze),
+    "individual": ("Generate individual report", _add_individual_arguments, run_individual),
+    "demo": ("Run demo with generated sample data", _add_demo_arguments, run_demo),
+}
+
+
 if __name__ == "__main__":
     main()
@@ -1,11 +1,36 @@
 """Data loaders for calendar and HRIS data."""
 
-from .outlook_loader import OutlookCalendarLoader
-from .hris_loader import HRISLoader
-from .data_processor import DataProcessor
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .outlook_loader import OutlookCalendarLoader
+    from .hris_loader import HRISLoader
+    from .data_processor import DataProcessor
+
+# Loaders are imported on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "OutlookCalendarLoader": ".outlook_loader",
+    "HRISLoader": ".hris_loader",
+    "DataProcessor": ".data_processor",
+}
 
 __all__ = [
     "OutlookCalendarLoader",
     "HRISLoader",
     "DataProcessor",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -1,13 +1,50 @@
 """Data processor for combining calendar and HRIS data."""
 
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
 from collections import defaultdict
 
 from ..models.calendar_event import CalendarEvent, Attendee
 from ..models.employee import Employee, Organization
 
 
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+def _time_keys(start_time: datetime) -> tuple[str, str, str, str]:
+    """
+    Build the (week, month, day of week, date) grouping keys for a start time.
+
+    Equivalent to strftime("%Y-W%W"), "%Y-%m", "%A" and "%Y-%m-%d", computed
+    arithmetically. Many events share a start time, so results are cached.
+    """
+    # Aware datetimes for the same instant compare equal across time zones
+    # but have different local dates, so the zone is part of the cache key
+    return _local_time_keys(start_time, start_time.tzinfo)
+
+
+@lru_cache(maxsize=4096)
+def _local_time_keys(start_time: datetime, tzinfo) -> tuple[str, str, str, str]:
+    """Build the keys for _time_keys; cached per (instant, time zone)."""
+    weekday = start_time.weekday()
+    year_day = start_time.timetuple().tm_yday - 1
+    week = (year_day + 7 - weekday) // 7
+
+    return (
+        f"{start_time.year}-W{week:02d}",
+        f"{start_time.year}-{start_time.month:02d}",
+        _DAY_NAMES[weekday],
+        start_time.date().isoformat(),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _series_key(subject: str) -> str:
+    """Build the series key for a recurring meeting from its subject."""
+    return f"recurring:{subject.lower().strip()}"
+
+
 class DataProcessor:
     """
     Processes and enriches calendar data with HRIS information.
@@ -33,15 +70,21 @@ class DataProcessor:
 
         Adds employee information to attendees where available.
         """
+        # Index lookups once instead of going through Organization per attendee
+        employees_by_email = self.org.employees
+        domain = self.org.domain.lower()
+
         for event in events:
             for attendee in event.attendees:
-                employee = self.org.get_employee(attendee.email)
+                email = attendee.email
+                employee = employees_by_email.get(email)
                 if employee:
                     if not attendee.name:
                         attendee.name = employee.name
                     attendee.is_external = False
                 else:
-                    attendee.is_external = not self.org.is_internal_email(attendee.email)
+                    _, at, email_domain = email.partition("@")
+                    attendee.is_external = not (at and email_domain == domain)
 
         return events
 
@@ -66,15 +109,18 @@ class DataProcessor:
     ) -> list[CalendarEvent]:
         """Filter events for a specific employee."""
         email_lower = email.lower()
-        filtered = []
 
-        for event in events:
-            if as_organizer and event.is_organizer(email_lower):
-                filtered.append(event)
-            elif as_attendee and event.has_attendee(email_lower):
-                filtered.append(event)
-
-        return filtered
+        # Pick the predicate once rather than re-checking both flags per event
+        if as_organizer and as_attendee:
+            return [
+                e for e in events
+                if e.is_organizer(email_lower) or e.has_attendee(email_lower)
+            ]
+        if as_organizer:
+            return [e for e in events if e.is_organizer(email_lower)]
+        if as_attendee:
+            return [e for e in events if e.has_attendee(email_lower)]
+        return []
 
     def filter_non_cancelled(self, events: list[CalendarEvent]) -> list[CalendarEvent]:
         """Filter out cancelled events."""
@@ -89,55 +135,48 @@ class DataProcessor:
             and e.attendee_count > 1
         ]
 
+    def _group(
+        self,
+        events: list[CalendarEvent],
+        keys: Iterable[str]
+    ) -> dict[str, list[CalendarEvent]]:
+        """
+        Group events by precomputed keys, parallel to the event list.
+
+        Groups are in order of first appearance and keep the input order.
+        """
+        grouped: dict[str, list[CalendarEvent]] = {}
+        for group_key, event in zip(keys, events):
+            grouped.setdefault(group_key, []).append(event)
+        return grouped
+
     def group_events_by_week(
         self,
         events: list[CalendarEvent]
     ) -> dict[str, list[CalendarEvent]]:
         """Group events by week (ISO week number)."""
-        grouped: dict[str, list[CalendarEvent]] = defaultdict(list)
-
-        for event in events:
-            week_key = event.start_time.strftime("%Y-W%W")
-            grouped[week_key].append(event)
-
-        return dict(grouped)
+        return self._group(events, (_time_keys(e.start_time)[0] for e in events))
 
     def group_events_by_month(
         self,
         events: list[CalendarEvent]
     ) -> dict[str, list[CalendarEvent]]:
         """Group events by month."""
-        grouped: dict[str, list[CalendarEvent]] = defaultdict(list)
-
-        for event in events:
-            month_key = event.start_time.strftime("%Y-%m")
-            grouped[month_key].append(event)
-
-        return dict(grouped)
+        return self._group(events, (_time_keys(e.start_time)[1] for e in events))
 
     def group_events_by_day_of_week(
         self,
         events: list[CalendarEvent]
     ) -> dict[str, list[CalendarEvent]]:
         """Group events by day of week."""
-        grouped: dict[str, list[CalendarEvent]] = defaultdict(list)
-
-        for event in events:
-            grouped[event.day_of_week].append(event)
-
-        return dict(grouped)
+        return self._group(events, (_time_keys(e.start_time)[2] for e in events))
 
     def group_events_by_organizer(
         self,
         events: list[CalendarEvent]
     ) -> dict[str, list[CalendarEvent]]:
         """Group events by organizer email."""
-        grouped: dict[str, list[CalendarEvent]] = defaultdict(list)
-
-        for event in events:
-            grouped[event.organizer_email.lower()].append(event)
-
-        return dict(grouped)
+        return self._group(events, (e.organizer_email for e in events))
 
     def get_recurring_events(self, events: list[CalendarEvent]) -> list[CalendarEvent]:
         """Get only recurring events."""
@@ -174,11 +213,12 @@ class DataProcessor:
         events: list[CalendarEvent]
     ) -> dict[str, float]:
         """Calculate meeting hours per day of week."""
-        by_day = self.group_events_by_day_of_week(events)
-        return {
-            day: self.calculate_total_meeting_hours(day_events)
-            for day, day_events in by_day.items()
-        }
+        # Sum straight into per-day totals instead of grouping events first
+        hours_by_day: dict[str, float] = defaultdict(float)
+        for event in events:
+            hours_by_day[_time_keys(event.start_time)[2]] += event.duration_hours
+
+        return dict(hours_by_day)
 
     def find_back_to_back_meetings(
         self,
@@ -191,22 +231,15 @@ class DataProcessor:
 
         # Sort by start time
         sorted_events = sorted(events, key=lambda e: e.start_time)
-        back_to_back = []
-
-        for i in range(len(sorted_events) - 1):
-            current = sorted_events[i]
-            next_event = sorted_events[i + 1]
+        buffer = timedelta(minutes=buffer_minutes)
 
-            # Same day check
-            if current.start_time.date() != next_event.start_time.date():
-                continue
-
-            gap = (next_event.start_time - current.end_time).total_seconds() / 60
-
-            if gap <= buffer_minutes:
-                back_to_back.append((current, next_event))
-
-        return back_to_back
+        # Compare timedeltas directly rather than converting each gap to minutes
+        return [
+            (current, next_event)
+            for current, next_event in zip(sorted_events, sorted_events[1:])
+            if next_event.start_time - current.end_time <= buffer
+            and current.start_time.date() == next_event.start_time.date()
+        ]
 
     def calculate_focus_time(
         self,
@@ -219,20 +252,16 @@ class DataProcessor:
 
         Returns dict with date string keys and hours of focus time.
         """
-        # Group by date
-        by_date: dict[str, list[CalendarEvent]] = defaultdict(list)
+        # Only the per-day totals are needed, so accumulate them directly
+        meeting_hours: dict[str, float] = defaultdict(float)
         for event in events:
-            date_key = event.start_time.strftime("%Y-%m-%d")
-            by_date[date_key].append(event)
+            meeting_hours[_time_keys(event.start_time)[3]] += event.duration_hours
 
-        focus_time = {}
         work_hours = work_end_hour - work_start_hour
-
-        for date_str, day_events in by_date.items():
-            meeting_hours = sum(e.duration_hours for e in day_events)
-            focus_time[date_str] = max(0, work_hours - meeting_hours)
-
-        return focus_time
+        return {
+            date_str: max(0, work_hours - hours)
+            for date_str, hours in meeting_hours.items()
+        }
 
     def get_meeting_participants_relationship(
         self,
@@ -263,13 +292,15 @@ class DataProcessor:
         teams = set(e.team for e in employees if e.team)
         functions = set(e.job_function for e in employees)
 
-        # Check for manager-report relationships
-        has_manager_report = False
-        for emp in employees:
-            for other in employees:
-                if emp != other and emp.reports_to(other):
-                    has_manager_report = True
-                    break
+        # Check for manager-report relationships: any participant whose
+        # manager is also in the meeting
+        participant_emails = {e.email.lower() for e in employees}
+        has_manager_report = any(
+            emp.manager_email
+            and emp.manager_email.lower() != emp.email.lower()
+            and emp.manager_email.lower() in participant_emails
+            for emp in employees
+        )
 
         return {
             "same_team": len(teams) == 1 and len(teams) > 0,
@@ -295,8 +326,7 @@ class DataProcessor:
                 series[event.series_master_id].append(event)
             elif event.is_recurring:
                 # Use subject as key for grouping
-                key = event.subject.lower().strip()
-                series[f"recurring:{key}"].append(event)
+                series[_series_key(event.subject)].append(event)
             else:
                 series[f"adhoc:{event.event_id}"].append(event)
 
@@ -310,22 +340,50 @@ class DataProcessor:
         """Get comprehensive meeting statistics for an employee."""
         employee_events = self.filter_events_by_employee(events, email)
         employee = self.org.get_employee(email)
+        email_lower = email.lower()
+
+        # Single pass over the employee's events
+        organized_count = 0
+        total_hours = 0.0
+        hours_organized = 0.0
+        hours_attended = 0.0
+        total_minutes = 0
+        one_on_ones = 0
+        recurring = 0
+        external = 0
+
+        for event in employee_events:
+            minutes = event.duration_minutes
+            hours = minutes / 60
+            total_minutes += minutes
+            total_hours += hours
+
+            if event.organizer_email == email_lower:
+                organized_count += 1
+                hours_organized += hours
+            else:
+                hours_attended += hours
+            if event.is_one_on_one:
+                one_on_ones += 1
+            if event.is_recurring:
+                recurring += 1
+            if event.has_external_attendees:
+                external += 1
 
-        organized = [e for e in employee_events if e.is_organizer(email)]
-        attended = [e for e in employee_events if not e.is_organizer(email)]
+        meeting_count = len(employee_events)
 
         return {
             "email": email,
             "name": employee.name if employee else email,
-            "total_meetings": len(employee_events),
-            "meetings_organized": len(organized),
-            "meetings_attended": len(attended),
-            "total_hours": self.calculate_total_meeting_hours(employee_events),
-            "hours_organized": self.calculate_total_meeting_hours(organized),
-            "hours_attended": self.calculate_total_meeting_hours(attended),
-            "avg_meeting_duration": self.calculate_average_meeting_duration(employee_events),
-            "one_on_ones": len(self.get_one_on_one_meetings(employee_events)),
-            "recurring_meetings": len(self.get_recurring_events(employee_events)),
-            "external_meetings": len(self.get_external_meetings(employee_events)),
+            "total_meetings": meeting_count,
+            "meetings_organized": organized_count,
+            "meetings_attended": meeting_count - organized_count,
+            "total_hours": total_hours,
+            "hours_organized": hours_organized,
+            "hours_attended": hours_attended,
+            "avg_meeting_duration": total_minutes / meeting_count if meeting_count else 0,
+            "one_on_ones": one_on_ones,
+            "recurring_meetings": recurring,
+            "external_meetings": external,
             "back_to_back_count": len(self.find_back_to_back_meetings(employee_events)),
         }
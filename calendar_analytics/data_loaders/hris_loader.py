@@ -2,8 +2,17 @@
 
 import csv
 import json
+import logging
+import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+try:
+    import orjson
+except ImportError:  # optional faster JSON parser
+    orjson = None
 
 from ..models.employee import (
     Employee,
@@ -13,6 +22,154 @@ from ..models.employee import (
     JobFunction,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def _intern(value):
+    """Intern a repeated string value so equal values share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Spellings of a true manager flag in HRIS exports
+_TRUE_VALUES = frozenset({"yes", "true", "1", "y"})
+
+# Default keyword maps for HRISLoader.JOB_LEVEL_MAP/JOB_FUNCTION_MAP. They
+# are read-only, so parse results cached against them cannot go stale
+_JOB_LEVEL_MAP = MappingProxyType({
+    # Common level naming conventions
+    "ic": JobLevel.INDIVIDUAL_CONTRIBUTOR,
+    "individual contributor": JobLevel.INDIVIDUAL_CONTRIBUTOR,
+    "associate": JobLevel.INDIVIDUAL_CONTRIBUTOR,
+    "junior": JobLevel.INDIVIDUAL_CONTRIBUTOR,
+    "entry": JobLevel.INDIVIDUAL_CONTRIBUTOR,
+    "senior": JobLevel.SENIOR_IC,
+    "senior ic": JobLevel.SENIOR_IC,
+    "staff": JobLevel.SENIOR_IC,
+    "lead": JobLevel.LEAD,
+    "tech lead": JobLevel.LEAD,
+    "team lead": JobLevel.LEAD,
+    "principal": JobLevel.LEAD,
+    "manager": JobLevel.MANAGER,
+    "people manager": JobLevel.MANAGER,
+    "senior manager": JobLevel.SENIOR_MANAGER,
+    "director": JobLevel.DIRECTOR,
+    "senior director": JobLevel.SENIOR_DIRECTOR,
+    "vp": JobLevel.VP,
+    "vice president": JobLevel.VP,
+    "svp": JobLevel.SVP,
+    "senior vice president": JobLevel.SVP,
+    "evp": JobLevel.SVP,
+    "c-level": JobLevel.C_LEVEL,
+    "ceo": JobLevel.C_LEVEL,
+    "cto": JobLevel.C_LEVEL,
+    "cfo": JobLevel.C_LEVEL,
+    "coo": JobLevel.C_LEVEL,
+    "cio": JobLevel.C_LEVEL,
+    "cpo": JobLevel.C_LEVEL,
+    "chief": JobLevel.C_LEVEL,
+})
+
+_JOB_FUNCTION_MAP = MappingProxyType({
+    # Common function naming conventions
+    "engineering": JobFunction.ENGINEERING,
+    "software": JobFunction.ENGINEERING,
+    "development": JobFunction.ENGINEERING,
+    "tech": JobFunction.ENGINEERING,
+    "technology": JobFunction.ENGINEERING,
+    "product": JobFunction.PRODUCT,
+    "product management": JobFunction.PRODUCT,
+    "design": JobFunction.DESIGN,
+    "ux": JobFunction.DESIGN,
+    "ui": JobFunction.DESIGN,
+    "data": JobFunction.DATA_SCIENCE,
+    "data science": JobFunction.DATA_SCIENCE,
+    "analytics": JobFunction.DATA_SCIENCE,
+    "ml": JobFunction.DATA_SCIENCE,
+    "machine learning": JobFunction.DATA_SCIENCE,
+    "sales": JobFunction.SALES,
+    "business development": JobFunction.SALES,
+    "account": JobFunction.SALES,
+    "marketing": JobFunction.MARKETING,
+    "growth": JobFunction.MARKETING,
+    "customer success": JobFunction.CUSTOMER_SUCCESS,
+    "cs": JobFunction.CUSTOMER_SUCCESS,
+    "support": JobFunction.CUSTOMER_SUCCESS,
+    "operations": JobFunction.OPERATIONS,
+    "ops": JobFunction.OPERATIONS,
+    "hr": JobFunction.HR,
+    "human resources": JobFunction.HR,
+    "people": JobFunction.HR,
+    "talent": JobFunction.HR,
+    "recruiting": JobFunction.HR,
+    "finance": JobFunction.FINANCE,
+    "accounting": JobFunction.FINANCE,
+    "legal": JobFunction.LEGAL,
+    "compliance": JobFunction.LEGAL,
+    "it": JobFunction.IT,
+    "infrastructure": JobFunction.IT,
+    "security": JobFunction.IT,
+    "executive": JobFunction.EXECUTIVE,
+    "admin": JobFunction.ADMIN,
+    "administrative": JobFunction.ADMIN,
+})
+
+
+def _parse_job_level(level_map: Mapping[str, JobLevel], level_str: str, job_title: str) -> JobLevel:
+    """Parse job level from a level string, falling back to the job title."""
+    if not level_str and not job_title:
+        return JobLevel.UNKNOWN
+
+    # Try level string first
+    if level_str:
+        level_lower = level_str.lower().strip()
+        if level_lower in level_map:
+            return level_map[level_lower]
+
+        # Try partial match. The first key in map order wins, so this
+        # stays an ordered scan rather than a longest-match search
+        for key, value in level_map.items():
+            if key in level_lower:
+                return value
+
+    # Try to infer from job title
+    if job_title:
+        title_lower = job_title.lower()
+        for key, value in level_map.items():
+            if key in title_lower:
+                return value
+
+    return JobLevel.UNKNOWN
+
+
+def _parse_job_function(
+    function_map: Mapping[str, JobFunction],
+    function_str: str,
+    job_title: str
+) -> JobFunction:
+    """Parse job function from a function string, falling back to the job title."""
+    if not function_str and not job_title:
+        return JobFunction.OTHER
+
+    # Try function string first
+    if function_str:
+        func_lower = function_str.lower().strip()
+        if func_lower in function_map:
+            return function_map[func_lower]
+
+        # Try partial match
+        for key, value in function_map.items():
+            if key in func_lower:
+                return value
+
+    # Try to infer from job title
+    if job_title:
+        title_lower = job_title.lower()
+        for key, value in function_map.items():
+            if key in title_lower:
+                return value
+
+    return JobFunction.OTHER
+
 
 class HRISLoader:
     """
@@ -25,82 +182,56 @@ class HRISLoader:
     - BambooHR-style exports
     """
 
-    JOB_LEVEL_MAP = {
-        # Common level naming conventions
-        "ic": JobLevel.INDIVIDUAL_CONTRIBUTOR,
-        "individual contributor": JobLevel.INDIVIDUAL_CONTRIBUTOR,
-        "associate": JobLevel.INDIVIDUAL_CONTRIBUTOR,
-        "junior": JobLevel.INDIVIDUAL_CONTRIBUTOR,
-        "entry": JobLevel.INDIVIDUAL_CONTRIBUTOR,
-        "senior": JobLevel.SENIOR_IC,
-        "senior ic": JobLevel.SENIOR_IC,
-        "staff": JobLevel.SENIOR_IC,
-        "lead": JobLevel.LEAD,
-        "tech lead": JobLevel.LEAD,
-        "team lead": JobLevel.LEAD,
-        "principal": JobLevel.LEAD,
-        "manager": JobLevel.MANAGER,
-        "people manager": JobLevel.MANAGER,
-        "senior manager": JobLevel.SENIOR_MANAGER,
-        "director": JobLevel.DIRECTOR,
-        "senior director": JobLevel.SENIOR_DIRECTOR,
-        "vp": JobLevel.VP,
-        "vice president": JobLevel.VP,
-        "svp": JobLevel.SVP,
-        "senior vice president": JobLevel.SVP,
-        "evp": JobLevel.SVP,
-        "c-level": JobLevel.C_LEVEL,
-        "ceo": JobLevel.C_LEVEL,
-        "cto": JobLevel.C_LEVEL,
-        "cfo": JobLevel.C_LEVEL,
-        "coo": JobLevel.C_LEVEL,
-        "cio": JobLevel.C_LEVEL,
-        "cpo": JobLevel.C_LEVEL,
-        "chief": JobLevel.C_LEVEL,
+    # Keyword -> level/function, in order of priority for partial matches.
+    # Read-only: to customize, assign a new mapping on a subclass or
+    # instance, e.g. {**HRISLoader.JOB_LEVEL_MAP, "head": JobLevel.DIRECTOR}
+    JOB_LEVEL_MAP = _JOB_LEVEL_MAP
+    JOB_FUNCTION_MAP = _JOB_FUNCTION_MAP
+
+    # Keys accepted per field in JSON/dict records, in order of preference
+    JSON_FIELD_ALIASES = {
+        "email": ["email", "work_email"],
+        "name": ["name", "full_name"],
+        "employee_id": ["employee_id", "id"],
+        "job_title": ["job_title", "title"],
+        "level": ["level", "job_level"],
+        "function": ["function", "department"],
+        "team": ["team"],
+        "manager_email": ["manager_email"],
+        "skip_level_manager": ["skip_level_manager_email"],
+        "location": ["location"],
+        "hire_date": ["hire_date"],
+        "is_manager": ["is_manager"],
+        "direct_reports": ["direct_reports"],
+        "cost_center": ["cost_center"],
+        "division": ["division"],
     }
 
-    JOB_FUNCTION_MAP = {
-        # Common function naming conventions
-        "engineering": JobFunction.ENGINEERING,
-        "software": JobFunction.ENGINEERING,
-        "development": JobFunction.ENGINEERING,
-        "tech": JobFunction.ENGINEERING,
-        "technology": JobFunction.ENGINEERING,
-        "product": JobFunction.PRODUCT,
-        "product management": JobFunction.PRODUCT,
-        "design": JobFunction.DESIGN,
-        "ux": JobFunction.DESIGN,
-        "ui": JobFunction.DESIGN,
-        "data": JobFunction.DATA_SCIENCE,
-        "data science": JobFunction.DATA_SCIENCE,
-        "analytics": JobFunction.DATA_SCIENCE,
-        "ml": JobFunction.DATA_SCIENCE,
-        "machine learning": JobFunction.DATA_SCIENCE,
-        "sales": JobFunction.SALES,
-        "business development": JobFunction.SALES,
-        "account": JobFunction.SALES,
-        "marketing": JobFunction.MARKETING,
-        "growth": JobFunction.MARKETING,
-        "customer success": JobFunction.CUSTOMER_SUCCESS,
-        "cs": JobFunction.CUSTOMER_SUCCESS,
-        "support": JobFunction.CUSTOMER_SUCCESS,
-        "operations": JobFunction.OPERATIONS,
-        "ops": JobFunction.OPERATIONS,
-        "hr": JobFunction.HR,
-        "human resources": JobFunction.HR,
-        "people": JobFunction.HR,
-        "talent": JobFunction.HR,
-        "recruiting": JobFunction.HR,
-        "finance": JobFunction.FINANCE,
-        "accounting": JobFunction.FINANCE,
-        "legal": JobFunction.LEGAL,
-        "compliance": JobFunction.LEGAL,
-        "it": JobFunction.IT,
-        "infrastructure": JobFunction.IT,
-        "security": JobFunction.IT,
-        "executive": JobFunction.EXECUTIVE,
-        "admin": JobFunction.ADMIN,
-        "administrative": JobFunction.ADMIN,
+    # Accepted CSV column names per field, in order of preference
+    CSV_FIELD_ALIASES = {
+        "email": ["email", "work_email", "corporate_email", "email_address"],
+        "name": ["name", "full_name", "employee_name", "display_name"],
+        "employee_id": ["employee_id", "id", "emp_id", "worker_id"],
+        "job_title": ["job_title", "title", "position", "role"],
+        "level": ["level", "job_level", "grade", "band"],
+        "function": [
+            "function", "job_function", "department", "dept",
+            "business_unit", "org_unit"
+        ],
+        "team": ["team", "team_name", "group"],
+        "manager_email": [
+            "manager_email", "manager", "reports_to",
+            "supervisor_email", "direct_manager"
+        ],
+        "skip_level_manager": [
+            "skip_level_manager", "skip_manager", "skip_level",
+            "second_level_manager", "grandmanager"
+        ],
+        "location": ["location", "office", "site", "work_location"],
+        "hire_date": ["hire_date", "start_date", "join_date"],
+        "is_manager": ["is_manager", "manager_flag", "people_manager"],
+        "cost_center": ["cost_center", "cost_centre"],
+        "division": ["division", "segment"],
     }
 
     def __init__(self, company_name: str = "", company_domain: str = ""):
@@ -113,6 +244,12 @@ class HRISLoader:
         """
         self.company_name = company_name
         self.company_domain = company_domain.lower()
+        self._parse_errors = 0
+        # Parsed (level or function string, title) pairs, which repeat
+        # heavily across an organization. Each cache remembers the map it
+        # was filled from, so a replaced JOB_*_MAP starts a fresh one
+        self._level_cache: tuple[Mapping, dict] = (self.JOB_LEVEL_MAP, {})
+        self._function_cache: tuple[Mapping, dict] = (self.JOB_FUNCTION_MAP, {})
 
     def load_csv(self, file_path: str | Path) -> Organization:
         """
@@ -144,10 +281,23 @@ class HRISLoader:
         file_path = Path(file_path)
 
         with open(file_path, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                employee = self._parse_csv_row(row)
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            columns = self._resolve_columns(headers)
+
+            # Read known fields by position; like DictReader, a repeated
+            # header maps to its last column and short rows read as None
+            positions = {header: i for i, header in enumerate(headers)}
+            fields = tuple(columns)
+            indices = [positions[columns[field]] for field in fields]
+            width = len(headers)
+
+            for values in reader:
+                if not values:
+                    continue
+                if len(values) < width:
+                    values += [None] * (width - len(values))
+                employee = self._parse_csv_fields(dict(zip(fields, map(values.__getitem__, indices))))
                 if employee:
                     org.add_employee(employee)
 
@@ -156,73 +306,46 @@ class HRISLoader:
 
         return org
 
-    def _parse_csv_row(self, row: dict) -> Optional[Employee]:
-        """Parse a single CSV row into an Employee."""
-        try:
-            # Flexible column name mapping
-            email = self._get_field(row, ["email", "work_email", "corporate_email", "email_address"])
-            if not email:
-                return None
+    def _parse_csv_row(
+        self,
+        row: dict,
+        columns: Optional[dict[str, str]] = None
+    ) -> Optional[Employee]:
+        """
+        Parse a single CSV row into an Employee.
 
-            name = self._get_field(row, ["name", "full_name", "employee_name", "display_name"])
-            employee_id = self._get_field(row, ["employee_id", "id", "emp_id", "worker_id"]) or email
-
-            job_title = self._get_field(row, ["job_title", "title", "position", "role"])
-            level_str = self._get_field(row, ["level", "job_level", "grade", "band"])
-            function_str = self._get_field(row, [
-                "function", "job_function", "department", "dept",
-                "business_unit", "org_unit"
-            ])
-
-            team = self._get_field(row, ["team", "team_name", "group"])
-            manager_email = self._get_field(row, [
-                "manager_email", "manager", "reports_to",
-                "supervisor_email", "direct_manager"
-            ])
-            skip_manager = self._get_field(row, [
-                "skip_level_manager", "skip_manager", "skip_level",
-                "second_level_manager", "grandmanager"
-            ])
-
-            location = self._get_field(row, ["location", "office", "site", "work_location"])
-            hire_date = self._get_field(row, ["hire_date", "start_date", "join_date"])
-            is_manager = self._get_field(row, ["is_manager", "manager_flag", "people_manager"])
-            cost_center = self._get_field(row, ["cost_center", "cost_centre"])
-            division = self._get_field(row, ["division", "segment"])
-
-            # Parse job level
-            job_level = self._parse_job_level(level_str, job_title)
-
-            # Parse job function
-            job_function = self._parse_job_function(function_str, job_title)
-
-            # Parse manager flag
-            is_manager_bool = str(is_manager).lower() in ["yes", "true", "1", "y"] if is_manager else False
-
-            employee = Employee(
-                employee_id=employee_id,
-                email=email.lower(),
-                name=name or email.split("@")[0].replace(".", " ").title(),
-                job_title=job_title or "",
-                job_level=job_level,
-                job_function=job_function,
-                department=function_str or "",
-                team=team or "",
-                location=location or "",
-                manager_email=manager_email.lower() if manager_email else None,
-                skip_level_manager_email=skip_manager.lower() if skip_manager else None,
-                hire_date=hire_date,
-                is_manager=is_manager_bool,
-                cost_center=cost_center or "",
-                division=division or "",
-                company_domain=self.company_domain,
-            )
-
-            return employee
+        Args:
+            row: CSV row keyed by header
+            columns: Field -> header mapping from _resolve_columns; resolved
+                from the row's own keys when not given
 
-        except Exception as e:
-            print(f"Error parsing HRIS row: {e}")
+        Returns:
+            Employee, or None if the row has no email
+        """
+        if columns is None:
+            columns = self._resolve_columns(row)
+        fields = {field: row.get(header) for field, header in columns.items()}
+        return self._parse_csv_fields(fields)
+
+    def _parse_csv_fields(self, fields: dict) -> Optional[Employee]:
+        """
+        Build an Employee from CSV values keyed by field name.
+
+        Args:
+            fields: Field name -> raw CSV value, for the fields present
+
+        Returns:
+            Employee, or None if there is no email
+        """
+        # csv yields only str or None values, so rows are validated with
+        # explicit guards instead of a blanket try/except
+        email = fields.get("email")
+        if not email:
             return None
+        # CSV exports without a name column get one derived from the email
+        if not fields.get("name"):
+            fields["name"] = email.split("@")[0].replace(".", " ").title()
+        return self._build_employee(fields)
 
     def load_json(self, file_path: str | Path) -> Organization:
         """
@@ -241,8 +364,11 @@ class HRISLoader:
 
         file_path = Path(file_path)
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(file_path.read_bytes())
+        else:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
 
         # Handle different JSON structures
         if isinstance(data, list):
@@ -254,11 +380,16 @@ class HRISLoader:
         else:
             employees_data = [data]
 
+        errors_before = self._parse_errors
         for emp_data in employees_data:
             employee = self._parse_json_employee(emp_data)
             if employee:
                 org.add_employee(employee)
 
+        skipped = self._parse_errors - errors_before
+        if skipped:
+            logger.warning("Skipped %d unparseable employees in %s", skipped, file_path)
+
         # Build manager relationships
         self._build_relationships(org)
 
@@ -267,145 +398,163 @@ class HRISLoader:
     def _parse_json_employee(self, data: dict) -> Optional[Employee]:
         """Parse a JSON object into an Employee."""
         try:
-            email = data.get("email", data.get("work_email", ""))
-            if not email:
+            fields = self._json_fields(data)
+            if not fields.get("email"):
                 return None
-
-            level_str = data.get("level", data.get("job_level", ""))
-            function_str = data.get("function", data.get("department", ""))
-            job_title = data.get("job_title", data.get("title", ""))
-
-            employee = Employee(
-                employee_id=data.get("employee_id", data.get("id", email)),
-                email=email.lower(),
-                name=data.get("name", data.get("full_name", "")),
-                job_title=job_title,
-                job_level=self._parse_job_level(level_str, job_title),
-                job_function=self._parse_job_function(function_str, job_title),
-                department=function_str,
-                team=data.get("team", ""),
-                location=data.get("location", ""),
-                manager_email=data.get("manager_email", "").lower() or None,
-                skip_level_manager_email=data.get("skip_level_manager_email", "").lower() or None,
-                hire_date=data.get("hire_date"),
-                is_manager=data.get("is_manager", False),
-                direct_reports=data.get("direct_reports", []),
-                cost_center=data.get("cost_center", ""),
-                division=data.get("division", ""),
-                company_domain=self.company_domain,
-            )
-
-            return employee
+            return self._build_employee(fields)
 
         except Exception as e:
-            print(f"Error parsing HRIS JSON: {e}")
+            # Per-record details only at debug level; load_json logs a summary
+            self._parse_errors += 1
+            logger.debug("Error parsing HRIS JSON: %s", e)
             return None
 
     def load_from_dict(self, data: dict) -> Employee:
         """Create an Employee from a dictionary."""
-        level_str = data.get("level", data.get("job_level", ""))
-        function_str = data.get("function", data.get("department", ""))
-        job_title = data.get("job_title", data.get("title", ""))
+        fields = self._json_fields(data)
+        fields.setdefault("email", "")
+        # Dict records take their id from "employee_id" only, falling back
+        # to the email; the "id" alias applies to JSON files
+        fields["employee_id"] = data.get("employee_id")
+        return self._build_employee(fields)
+
+    def _json_fields(self, data: dict) -> dict:
+        """Adapt a JSON/dict employee record to canonical field names."""
+        fields = {}
+        for field, aliases in self.JSON_FIELD_ALIASES.items():
+            for alias in aliases:
+                if alias in data:
+                    fields[field] = data[alias]
+                    break
+        return fields
+
+    def _build_employee(self, fields: dict) -> Employee:
+        """
+        Build an Employee from values keyed by canonical field name.
+
+        Every loader adapts its input to these names (those of
+        CSV_FIELD_ALIASES plus "direct_reports") and shares this constructor.
+
+        Args:
+            fields: Field name -> raw value, for the fields present; must
+                include "email"
+
+        Returns:
+            Employee object
+        """
+        email = fields["email"]
+        job_title = fields.get("job_title") or ""
+        function_str = fields.get("function") or ""
+        manager_email = fields.get("manager_email")
+        skip_manager = fields.get("skip_level_manager")
+
+        # Parse manager flag
+        is_manager = fields.get("is_manager")
+        if not isinstance(is_manager, bool):
+            is_manager = str(is_manager).lower() in _TRUE_VALUES if is_manager else False
 
         return Employee(
-            employee_id=data.get("employee_id", data.get("email", "")),
-            email=data.get("email", "").lower(),
-            name=data.get("name", ""),
-            job_title=job_title,
-            job_level=self._parse_job_level(level_str, job_title),
+            employee_id=fields.get("employee_id") or email,
+            email=email,
+            name=fields.get("name") or "",
+            job_title=_intern(job_title),
+            job_level=self._parse_job_level(fields.get("level"), job_title),
             job_function=self._parse_job_function(function_str, job_title),
-            department=function_str,
-            team=data.get("team", ""),
-            location=data.get("location", ""),
-            manager_email=data.get("manager_email", "").lower() or None,
-            skip_level_manager_email=data.get("skip_level_manager_email", "").lower() or None,
-            hire_date=data.get("hire_date"),
-            is_manager=data.get("is_manager", False),
-            direct_reports=data.get("direct_reports", []),
-            cost_center=data.get("cost_center", ""),
-            division=data.get("division", ""),
+            department=_intern(function_str),
+            team=_intern(fields.get("team") or ""),
+            location=_intern(fields.get("location") or ""),
+            manager_email=manager_email or None,
+            skip_level_manager_email=skip_manager or None,
+            hire_date=fields.get("hire_date"),
+            is_manager=is_manager,
+            direct_reports=fields.get("direct_reports") or [],
+            cost_center=_intern(fields.get("cost_center") or ""),
+            division=_intern(fields.get("division") or ""),
             company_domain=self.company_domain,
         )
 
-    def _get_field(self, row: dict, possible_names: list[str]) -> Optional[str]:
-        """Get a field value trying multiple possible column names."""
-        for name in possible_names:
-            # Try exact match
-            if name in row:
-                return row[name]
-            # Try case-insensitive match
-            for key in row:
-                if key.lower().replace(" ", "_") == name.lower().replace(" ", "_"):
-                    return row[key]
-        return None
+    def _resolve_columns(self, headers) -> dict[str, str]:
+        """
+        Map each known field to the CSV header that holds it.
+
+        Aliases are tried in order of preference, first as an exact header
+        and then case- and space-insensitively, so the lookup runs once per
+        file instead of once per row.
+
+        Args:
+            headers: CSV header names (a row dict works too)
+
+        Returns:
+            Dictionary of field name -> header name for the fields present
+        """
+        headers = [h for h in headers if h is not None]
+        exact = set(headers)
+        normalized: dict[str, str] = {}
+        for header in headers:
+            normalized.setdefault(header.lower().replace(" ", "_"), header)
+
+        columns = {}
+        for field, aliases in self.CSV_FIELD_ALIASES.items():
+            for alias in aliases:
+                if alias in exact:
+                    columns[field] = alias
+                    break
+                header = normalized.get(alias.lower().replace(" ", "_"))
+                if header is not None:
+                    columns[field] = header
+                    break
+        return columns
 
     def _parse_job_level(self, level_str: Optional[str], job_title: str = "") -> JobLevel:
         """Parse job level from string."""
-        if not level_str and not job_title:
-            return JobLevel.UNKNOWN
-
-        # Try level string first
-        if level_str:
-            level_lower = level_str.lower().strip()
-            if level_lower in self.JOB_LEVEL_MAP:
-                return self.JOB_LEVEL_MAP[level_lower]
-
-            # Try partial match
-            for key, value in self.JOB_LEVEL_MAP.items():
-                if key in level_lower:
-                    return value
-
-        # Try to infer from job title
-        if job_title:
-            title_lower = job_title.lower()
-            for key, value in self.JOB_LEVEL_MAP.items():
-                if key in title_lower:
-                    return value
+        level_map, cache = self._level_cache
+        if level_map is not self.JOB_LEVEL_MAP:
+            level_map, cache = self._level_cache = (self.JOB_LEVEL_MAP, {})
 
-        return JobLevel.UNKNOWN
+        key = (level_str or "", job_title or "")
+        level = cache.get(key)
+        if level is None:
+            level = cache[key] = _parse_job_level(level_map, *key)
+        return level
 
     def _parse_job_function(self, function_str: Optional[str], job_title: str = "") -> JobFunction:
         """Parse job function from string."""
-        if not function_str and not job_title:
-            return JobFunction.OTHER
-
-        # Try function string first
-        if function_str:
-            func_lower = function_str.lower().strip()
-            if func_lower in self.JOB_FUNCTION_MAP:
-                return self.JOB_FUNCTION_MAP[func_lower]
-
-            # Try partial match
-            for key, value in self.JOB_FUNCTION_MAP.items():
-                if key in func_lower:
-                    return value
-
-        # Try to infer from job title
-        if job_title:
-            title_lower = job_title.lower()
-            for key, value in self.JOB_FUNCTION_MAP.items():
-                if key in title_lower:
-                    return value
+        function_map, cache = self._function_cache
+        if function_map is not self.JOB_FUNCTION_MAP:
+            function_map, cache = self._function_cache = (self.JOB_FUNCTION_MAP, {})
 
-        return JobFunction.OTHER
+        key = (function_str or "", job_title or "")
+        function = cache.get(key)
+        if function is None:
+            function = cache[key] = _parse_job_function(function_map, *key)
+        return function
 
     def _build_relationships(self, org: Organization) -> None:
         """Build manager-report relationships in the organization."""
-        # Build direct reports lists
+        # One pass: collect reports per manager and fill in skip-levels
+        reports_by_manager: dict[str, list[str]] = defaultdict(list)
         for employee in org.employees.values():
-            if employee.manager_email:
-                manager = org.get_employee(employee.manager_email)
-                if manager and employee.email not in manager.direct_reports:
-                    manager.direct_reports.append(employee.email)
-                    manager.is_manager = True
+            if not employee.manager_email:
+                continue
+            reports_by_manager[employee.manager_email].append(employee.email)
 
-        # Build skip-level relationships if not already set
-        for employee in org.employees.values():
-            if not employee.skip_level_manager_email and employee.manager_email:
+            # Build skip-level relationships if not already set
+            if not employee.skip_level_manager_email:
                 manager = org.get_employee(employee.manager_email)
                 if manager and manager.manager_email:
                     employee.skip_level_manager_email = manager.manager_email
 
+        # Merge each manager's reports in one step
+        for manager_email, report_emails in reports_by_manager.items():
+            manager = org.get_employee(manager_email)
+            if not manager:
+                continue
+            existing = set(manager.direct_reports)
+            new_reports = [e for e in dict.fromkeys(report_emails) if e not in existing]
+            if new_reports:
+                manager.direct_reports.extend(new_reports)
+                manager.is_manager = True
+
     def create_organization_from_employees(
         self,
         employees: list[dict],
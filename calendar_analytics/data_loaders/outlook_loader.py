@@ -2,9 +2,19 @@
 
 import csv
 import json
+import logging
+import re
+import sys
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # optional faster JSON parser
+    orjson = None
 
 from ..models.calendar_event import (
     CalendarEvent,
@@ -12,6 +22,74 @@ from ..models.calendar_event import (
     AttendeeResponse,
 )
 
+logger = logging.getLogger(__name__)
+
+
+# Accepted datetime formats, in order of precedence
+DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%m/%d/%Y %I:%M:%S %p",
+    "%m/%d/%Y %H:%M",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+)
+
+# ":" and "/" only occur as literals in the formats above, so a string can
+# only match formats with the same count of each
+_FORMATS_BY_SHAPE: dict[tuple[int, int], list[str]] = {}
+for _fmt in DATETIME_FORMATS:
+    _FORMATS_BY_SHAPE.setdefault((_fmt.count(":"), _fmt.count("/")), []).append(_fmt)
+del _fmt
+
+# Zero-padded strings in exactly the shapes of the first five formats
+_ISO_DATETIME_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:T\d{2}:\d{2}:\d{2}(?:(?:\.\d{1,6})?Z)?|[ ]\d{2}:\d{2}(?::\d{2})?)",
+    re.ASCII,
+)
+
+
+@lru_cache(maxsize=8192)
+def _parse_datetime(dt_str: str) -> Optional[datetime]:
+    """
+    Parse a stripped datetime string against DATETIME_FORMATS.
+
+    ISO-style strings go straight to datetime.fromisoformat. Otherwise
+    only the formats with the same number of ":" and "/" separators are
+    tried, in DATETIME_FORMATS order, so a string pays for at most two
+    failed strptime calls instead of up to eight. Meeting start and end
+    times repeat across events and calendars, so results are cached.
+    """
+    if _ISO_DATETIME_RE.fullmatch(dt_str):
+        try:
+            return datetime.fromisoformat(dt_str.rstrip("Z"))
+        except ValueError:
+            pass
+
+    shape = (dt_str.count(":"), dt_str.count("/"))
+    for fmt in _FORMATS_BY_SHAPE.get(shape, ()):
+        try:
+            return datetime.strptime(dt_str, fmt)
+        except ValueError:
+            continue
+
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _is_external_email(email: str, company_domain: str) -> bool:
+    """
+    Check whether an email's domain differs from the company domain.
+
+    The same attendees recur across events and calendars, so results are
+    cached per address.
+    """
+    return email.split("@")[1].lower() != company_domain
+
 
 class OutlookCalendarLoader:
     """
@@ -33,6 +111,27 @@ class OutlookCalendarLoader:
         "organizer": AttendeeResponse.ORGANIZER,
     }
 
+    # Field -> accepted CSV headers, Outlook export name first
+    CSV_FIELD_ALIASES = {
+        "subject": ("Subject", "subject"),
+        "start_date": ("Start Date", "start_date"),
+        "start_time": ("Start Time", "start_time"),
+        "end_date": ("End Date", "end_date"),
+        "end_time": ("End Time", "end_time"),
+        "attendees": ("Required Attendees", "attendees"),
+        "optional_attendees": ("Optional Attendees", "optional_attendees"),
+        "organizer": ("Organizer", "organizer"),
+        "is_recurring": ("Recurring", "is_recurring"),
+        "recurrence_pattern": ("Recurrence Pattern", "recurrence_pattern"),
+        "is_all_day": ("All day event", "is_all_day"),
+        "event_id": ("UID", "event_id"),
+        "location": ("Location", "location"),
+        "body": ("Description", "body"),
+        "categories": ("Categories", "categories"),
+        "importance": ("Priority", "importance"),
+        "show_as": ("Show As", "show_as"),
+    }
+
     def __init__(self, company_domain: str = ""):
         """
         Initialize the loader.
@@ -41,40 +140,133 @@ class OutlookCalendarLoader:
             company_domain: Company email domain for identifying external attendees
         """
         self.company_domain = company_domain.lower()
+        self._parse_errors = 0
 
-    def load_csv(self, file_path: str | Path, owner_email: str = "") -> list[CalendarEvent]:
+    def load_csv(
+        self,
+        file_path: str | Path,
+        owner_email: str = "",
+        max_rows: Optional[int] = None
+    ) -> list[CalendarEvent]:
         """
         Load calendar events from Outlook CSV export.
 
         Args:
             file_path: Path to the CSV file
             owner_email: Email of the calendar owner
+            max_rows: Stop reading once this many events are loaded
 
         Returns:
             List of CalendarEvent objects
         """
-        events = []
+        return list(islice(self.iter_csv(file_path, owner_email), max_rows))
+
+    def iter_csv(self, file_path: str | Path, owner_email: str = "") -> Iterator[CalendarEvent]:
+        """
+        Stream calendar events from Outlook CSV export one row at a time.
+
+        Args:
+            file_path: Path to the CSV file
+            owner_email: Email of the calendar owner
+
+        Yields:
+            CalendarEvent objects
+        """
         file_path = Path(file_path)
+        errors_before = self._parse_errors
 
         with open(file_path, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                event = self._parse_csv_row(row, owner_email)
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            columns = self._resolve_columns(headers)
+
+            # Read known fields by position; like DictReader, a repeated
+            # header maps to its last column and short rows read as None
+            positions = {header: i for i, header in enumerate(headers)}
+            fields = tuple(columns)
+            indices = [positions[columns[field]] for field in fields]
+            width = len(headers)
+
+            for values in reader:
+                if not values:
+                    continue
+                if len(values) < width:
+                    values += [None] * (width - len(values))
+                event = self._parse_csv_fields(
+                    dict(zip(fields, map(values.__getitem__, indices))), owner_email
+                )
                 if event:
-                    events.append(event)
+                    yield event
+
+        self._log_parse_errors(file_path, errors_before)
+
+    def _log_parse_errors(self, file_path: Path, errors_before: int) -> None:
+        """Log one summary warning for the records of a file that failed to parse."""
+        skipped = self._parse_errors - errors_before
+        if skipped:
+            logger.warning("Skipped %d unparseable events in %s", skipped, file_path)
+
+    def _resolve_columns(self, headers) -> dict[str, str]:
+        """
+        Map each known field to the CSV header that holds it.
+
+        The naming convention is fixed for a whole file, so it is resolved
+        once from the header instead of on every row.
+
+        Args:
+            headers: CSV header names (a row dict works too)
+
+        Returns:
+            Dictionary of field name -> header name for the fields present
+        """
+        present = set(headers)
+        columns = {}
+        for field, aliases in self.CSV_FIELD_ALIASES.items():
+            for alias in aliases:
+                if alias in present:
+                    columns[field] = alias
+                    break
+        return columns
+
+    def _parse_csv_row(
+        self, row: dict, owner_email: str, columns: Optional[dict[str, str]] = None
+    ) -> Optional[CalendarEvent]:
+        """
+        Parse a single CSV row into a CalendarEvent.
+
+        Args:
+            row: CSV row keyed by header
+            owner_email: Email of the calendar owner
+            columns: Field -> header mapping from _resolve_columns; resolved
+                from the row's own keys when not given
+
+        Returns:
+            CalendarEvent, or None if the row cannot be parsed
+        """
+        if columns is None:
+            columns = self._resolve_columns(row)
+        fields = {field: row[header] for field, header in columns.items()}
+        return self._parse_csv_fields(fields, owner_email)
+
+    def _parse_csv_fields(self, fields: dict, owner_email: str) -> Optional[CalendarEvent]:
+        """
+        Build a CalendarEvent from CSV values keyed by field name.
 
-        return events
+        Args:
+            fields: Field name -> raw CSV value, for the fields present
+            owner_email: Email of the calendar owner
+
+        Returns:
+            CalendarEvent, or None if the values cannot be parsed
+        """
+        get = fields.get
 
-    def _parse_csv_row(self, row: dict, owner_email: str) -> Optional[CalendarEvent]:
-        """Parse a single CSV row into a CalendarEvent."""
         try:
-            # Handle different CSV column naming conventions
-            subject = row.get("Subject", row.get("subject", ""))
-            start_date = row.get("Start Date", row.get("start_date", ""))
-            start_time = row.get("Start Time", row.get("start_time", ""))
-            end_date = row.get("End Date", row.get("end_date", ""))
-            end_time = row.get("End Time", row.get("end_time", ""))
+            subject = get("subject", "")
+            start_date = get("start_date", "")
+            start_time = get("start_time", "")
+            end_date = get("end_date", "")
+            end_time = get("end_time", "")
 
             # Parse datetime
             start_str = f"{start_date} {start_time}"
@@ -88,41 +280,51 @@ class OutlookCalendarLoader:
                 return None
 
             # Parse attendees
-            attendees_str = row.get("Required Attendees", row.get("attendees", ""))
-            optional_str = row.get("Optional Attendees", row.get("optional_attendees", ""))
-            organizer = row.get("Organizer", row.get("organizer", owner_email))
+            attendees_str = get("attendees", "")
+            optional_str = get("optional_attendees", "")
+            organizer = get("organizer", owner_email)
 
             attendees = self._parse_attendees_string(attendees_str, required=True)
             attendees.extend(self._parse_attendees_string(optional_str, required=False))
 
             # Determine if recurring
-            is_recurring = row.get("Recurring", row.get("is_recurring", "")).lower() in ["yes", "true", "1"]
-            recurrence = row.get("Recurrence Pattern", row.get("recurrence_pattern", ""))
+            is_recurring = get("is_recurring", "").lower() in ["yes", "true", "1"]
+            recurrence = get("recurrence_pattern", "")
 
             # Check if all day
-            is_all_day = row.get("All day event", row.get("is_all_day", "")).lower() in ["yes", "true", "1"]
+            is_all_day = get("is_all_day", "").lower() in ["yes", "true", "1"]
+
+            # Only hash a fallback ID when the export has no ID column
+            if "event_id" in fields:
+                event_id = fields["event_id"]
+            else:
+                event_id = f"evt_{hash(subject + str(start_dt))}"
 
+            # importance and show_as take a handful of values; interning
+            # lets every event share one string object per value
             event = CalendarEvent(
-                event_id=row.get("UID", row.get("event_id", f"evt_{hash(subject + str(start_dt))}")),
+                event_id=event_id,
                 subject=subject,
                 organizer_email=organizer or owner_email,
                 start_time=start_dt,
                 end_time=end_dt,
                 attendees=attendees,
-                location=row.get("Location", row.get("location", "")),
-                body=row.get("Description", row.get("body", "")),
+                location=get("location", ""),
+                body=get("body", ""),
                 is_recurring=is_recurring,
                 recurrence_pattern=recurrence if recurrence else None,
                 is_all_day=is_all_day,
-                categories=self._parse_categories(row.get("Categories", row.get("categories", ""))),
-                importance=row.get("Priority", row.get("importance", "normal")).lower(),
-                show_as=row.get("Show As", row.get("show_as", "busy")).lower(),
+                categories=self._parse_categories(get("categories", "")),
+                importance=sys.intern(get("importance", "normal").lower()),
+                show_as=sys.intern(get("show_as", "busy").lower()),
             )
 
             return event
 
         except Exception as e:
-            print(f"Error parsing CSV row: {e}")
+            # Per-row details only at debug level; iter_csv logs a summary
+            self._parse_errors += 1
+            logger.debug("Error parsing CSV row: %s", e)
             return None
 
     def load_json(self, file_path: str | Path, owner_email: str = "") -> list[CalendarEvent]:
@@ -136,21 +338,49 @@ class OutlookCalendarLoader:
         Returns:
             List of CalendarEvent objects
         """
-        events = []
+        return list(self.iter_json(file_path, owner_email))
+
+    def iter_json(self, file_path: str | Path, owner_email: str = "") -> Iterator[CalendarEvent]:
+        """
+        Stream calendar events from Microsoft Graph API JSON export.
+
+        The file is decoded in one go, but events are built one at a time
+        as they are consumed.
+
+        Args:
+            file_path: Path to the JSON file
+            owner_email: Email of the calendar owner
+
+        Yields:
+            CalendarEvent objects
+
+        Raises:
+            ValueError: If the file is a list of event IDs from a shared
+                events export
+        """
         file_path = Path(file_path)
+        errors_before = self._parse_errors
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(file_path.read_bytes())
+        else:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
 
         # Handle both single event and array of events
         event_list = data if isinstance(data, list) else data.get("value", [data])
+        if event_list and isinstance(event_list[0], str):
+            raise ValueError(
+                f"{file_path} lists event IDs; load calendars exported with a "
+                "shared events file using load_shared_calendars"
+            )
 
         for event_data in event_list:
             event = self._parse_graph_event(event_data, owner_email)
             if event:
-                events.append(event)
+                yield event
 
-        return events
+        self._log_parse_errors(file_path, errors_before)
 
     def _parse_graph_event(self, data: dict, owner_email: str) -> Optional[CalendarEvent]:
         """Parse a Microsoft Graph API event object."""
@@ -194,6 +424,7 @@ class OutlookCalendarLoader:
             online_meeting = data.get("onlineMeeting", {})
             online_url = online_meeting.get("joinUrl", "") if online_meeting else ""
 
+            # Low-cardinality strings are interned, as in _parse_csv_row
             event = CalendarEvent(
                 event_id=data.get("id", data.get("iCalUId", "")),
                 subject=data.get("subject", ""),
@@ -207,10 +438,10 @@ class OutlookCalendarLoader:
                 recurrence_pattern=json.dumps(data.get("recurrence")) if data.get("recurrence") else None,
                 is_cancelled=data.get("isCancelled", False),
                 is_all_day=data.get("isAllDay", False),
-                sensitivity=data.get("sensitivity", "normal").lower(),
-                show_as=data.get("showAs", "busy").lower(),
+                sensitivity=sys.intern(data.get("sensitivity", "normal").lower()),
+                show_as=sys.intern(data.get("showAs", "busy").lower()),
                 categories=data.get("categories", []),
-                importance=data.get("importance", "normal").lower(),
+                importance=sys.intern(data.get("importance", "normal").lower()),
                 created_time=self._parse_datetime(data.get("createdDateTime")),
                 modified_time=self._parse_datetime(data.get("lastModifiedDateTime")),
                 series_master_id=data.get("seriesMasterId"),
@@ -220,7 +451,8 @@ class OutlookCalendarLoader:
             return event
 
         except Exception as e:
-            print(f"Error parsing Graph event: {e}")
+            self._parse_errors += 1
+            logger.debug("Error parsing Graph event: %s", e)
             return None
 
     def load_from_dict(self, data: dict, owner_email: str = "") -> CalendarEvent:
@@ -256,8 +488,11 @@ class OutlookCalendarLoader:
         if isinstance(end_time, str):
             end_time = self._parse_datetime(end_time)
 
+        # The fallback ID hashes the whole record, so build it only when needed
+        event_id = data["event_id"] if "event_id" in data else f"evt_{hash(str(data))}"
+
         return CalendarEvent(
-            event_id=data.get("event_id", f"evt_{hash(str(data))}"),
+            event_id=event_id,
             subject=data.get("subject", ""),
             organizer_email=data.get("organizer_email", owner_email),
             start_time=start_time,
@@ -273,30 +508,49 @@ class OutlookCalendarLoader:
             importance=data.get("importance", "normal"),
         )
 
+    def load_shared_calendars(
+        self,
+        events_path: str | Path,
+        file_paths: dict[str, str | Path]
+    ) -> dict[str, list[CalendarEvent]]:
+        """
+        Load calendars exported with a shared events file.
+
+        ``events_path`` is a JSON Lines file of event dicts (as accepted by
+        load_from_dict), each event once; each calendar file is a JSON
+        array of the event IDs on that person's calendar. Calendars that
+        list the same ID share one CalendarEvent object.
+
+        Args:
+            events_path: Path to the shared events file
+            file_paths: Dict mapping email to calendar file path
+
+        Returns:
+            Dict mapping email to list of events
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+
+        events_by_id: dict[str, CalendarEvent] = {}
+        with open(events_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    event = self.load_from_dict(loads(line))
+                    events_by_id[event.event_id] = event
+
+        calendars = {}
+        for email, path in file_paths.items():
+            event_ids = loads(Path(path).read_bytes())
+            calendars[email] = [
+                events_by_id[event_id] for event_id in event_ids
+                if event_id in events_by_id
+            ]
+        return calendars
+
     def _parse_datetime(self, dt_str: Optional[str]) -> Optional[datetime]:
         """Parse datetime string in various formats."""
         if not dt_str:
             return None
-
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M",
-            "%m/%d/%Y %I:%M:%S %p",
-            "%m/%d/%Y %H:%M",
-            "%d/%m/%Y %H:%M:%S",
-            "%d/%m/%Y %H:%M",
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(dt_str.strip(), fmt)
-            except ValueError:
-                continue
-
-        return None
+        return _parse_datetime(dt_str.strip())
 
     def _parse_attendees_string(self, attendees_str: str, required: bool = True) -> list[Attendee]:
         """Parse attendees from a comma/semicolon-separated string."""
@@ -304,23 +558,21 @@ class OutlookCalendarLoader:
             return []
 
         attendees = []
-        # Split by common delimiters
-        for delimiter in [";", ","]:
-            if delimiter in attendees_str:
-                parts = attendees_str.split(delimiter)
-                break
-        else:
-            parts = [attendees_str]
+        # Semicolons take precedence, so "Last, First <email>" entries in a
+        # semicolon-separated list stay whole
+        delimiter = ";" if ";" in attendees_str else ","
 
-        for part in parts:
+        for part in attendees_str.split(delimiter):
             part = part.strip()
             if not part:
                 continue
 
             # Try to extract email from "Name <email>" format
-            if "<" in part and ">" in part:
-                name = part[:part.index("<")].strip()
-                email = part[part.index("<")+1:part.index(">")].strip()
+            open_at = part.find("<")
+            close_at = part.find(">")
+            if open_at >= 0 and close_at >= 0:
+                name = part[:open_at].strip()
+                email = part[open_at + 1:close_at].strip()
             elif "@" in part:
                 email = part
                 name = ""
@@ -352,8 +604,7 @@ class OutlookCalendarLoader:
         if not self.company_domain or "@" not in email:
             return False
 
-        email_domain = email.split("@")[1].lower()
-        return email_domain != self.company_domain
+        return _is_external_email(email, self.company_domain)
 
     def load_multiple_calendars(
         self,
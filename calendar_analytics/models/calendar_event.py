@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
 import re
+import sys
 
 
 class AttendeeResponse(Enum):
@@ -16,6 +17,12 @@ class AttendeeResponse(Enum):
     ORGANIZER = "organizer"
 
 
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Responses that count towards CalendarEvent.get_response_rate
+_RESPONDED = (AttendeeResponse.ACCEPTED, AttendeeResponse.DECLINED, AttendeeResponse.TENTATIVE)
+
+
 class MeetingType(Enum):
     """Classification of meeting types."""
     ONE_ON_ONE = "1:1"
@@ -45,7 +52,58 @@ class MeetingCategory(Enum):
     OTHER = "other"
 
 
-@dataclass
+# Keywords for classify_meeting_text, in order of precedence
+_CATEGORY_KEYWORDS = {
+    MeetingCategory.STATUS_UPDATE: ("status", "standup", "stand-up", "sync", "check-in", "check in", "weekly", "daily"),
+    MeetingCategory.PLANNING: ("planning", "plan", "roadmap", "sprint", "backlog", "quarterly"),
+    MeetingCategory.REVIEW: ("review", "retrospective", "retro", "post-mortem", "postmortem", "feedback"),
+    MeetingCategory.BRAINSTORM: ("brainstorm", "ideation", "workshop", "design thinking", "whiteboard"),
+    MeetingCategory.DECISION: ("decision", "approve", "approval", "sign-off", "signoff", "go/no-go"),
+    MeetingCategory.TRAINING: ("training", "onboarding", "learning", "tutorial", "demo", "demonstration"),
+    MeetingCategory.SOCIAL: ("happy hour", "team building", "celebration", "birthday", "farewell", "lunch", "coffee"),
+    MeetingCategory.CLIENT_MEETING: ("client", "customer", "sales call", "pitch", "proposal", "demo"),
+    MeetingCategory.INTERVIEW: ("interview", "hiring", "candidate", "recruitment"),
+    MeetingCategory.PERFORMANCE: ("performance", "1:1", "one-on-one", "career", "growth", "development"),
+    MeetingCategory.PROJECT: ("project", "kickoff", "kick-off", "milestone", "deliverable"),
+    MeetingCategory.OPERATIONAL: ("ops", "operational", "incident", "outage", "on-call", "support"),
+    MeetingCategory.STRATEGIC: ("strategy", "strategic", "vision", "leadership", "exec", "board"),
+}
+
+# Keyword -> category; a keyword listed twice keeps its first category
+_CATEGORY_BY_KEYWORD: dict[str, MeetingCategory] = {}
+for _category, _keywords in _CATEGORY_KEYWORDS.items():
+    for _keyword in _keywords:
+        _CATEGORY_BY_KEYWORD.setdefault(_keyword, _category)
+del _category, _keywords, _keyword
+
+# Precedence rank of each category, lowest first
+_CATEGORY_RANK = {category: rank for rank, category in enumerate(_CATEGORY_KEYWORDS)}
+
+# All keywords as one alternation so a single scan finds the keywords in the text
+_CATEGORY_RE = re.compile("|".join(map(re.escape, _CATEGORY_BY_KEYWORD)))
+
+
+def classify_meeting_text(text: str) -> MeetingCategory:
+    """
+    Classify meeting text (such as a subject) by its keywords.
+
+    Keywords match anywhere in the text, including inside longer words.
+    When several categories match, the one listed first in
+    _CATEGORY_KEYWORDS wins, wherever in the text its keyword appears.
+    """
+    best = MeetingCategory.OTHER
+    best_rank = len(_CATEGORY_RANK)
+    for match in _CATEGORY_RE.finditer(text.lower()):
+        category = _CATEGORY_BY_KEYWORD[match.group()]
+        rank = _CATEGORY_RANK[category]
+        if rank < best_rank:
+            if rank == 0:
+                return category
+            best, best_rank = category, rank
+    return best
+
+
+@dataclass(slots=True)
 class Attendee:
     """Meeting attendee information."""
     email: str
@@ -56,11 +114,14 @@ class Attendee:
     is_external: bool = False
 
     def __post_init__(self):
+        # Emails are compared case-insensitively; normalize once here. The
+        # same people attend many meetings, so attendees share one string
+        self.email = sys.intern(self.email.lower())
         if not self.name:
-            self.name = self.email.split("@")[0].replace(".", " ").title()
+            self.name = sys.intern(self.email.split("@")[0].replace(".", " ").title())
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarEvent:
     """Represents a calendar event from Outlook 365."""
 
@@ -86,9 +147,15 @@ class CalendarEvent:
     series_master_id: Optional[str] = None
     online_meeting_url: Optional[str] = None
 
+    def __post_init__(self):
+        # Lowercase once so lookups and grouping can compare directly. Loaders
+        # may pass None for a missing organizer
+        self.organizer_email = sys.intern((self.organizer_email or "").lower())
+
     @property
     def duration_minutes(self) -> int:
         """Calculate meeting duration in minutes."""
+        # Derived on access: start_time and end_time may be reassigned
         delta = self.end_time - self.start_time
         return int(delta.total_seconds() / 60)
 
@@ -131,7 +198,7 @@ class CalendarEvent:
     @property
     def day_of_week(self) -> str:
         """Get day of week for the meeting."""
-        return self.start_time.strftime("%A")
+        return _DAY_NAMES[self.start_time.weekday()]
 
     @property
     def hour_of_day(self) -> int:
@@ -190,30 +257,7 @@ class CalendarEvent:
 
     def classify_meeting_category(self) -> MeetingCategory:
         """Classify meeting based on subject and body text."""
-        text = f"{self.subject} {self.body}".lower()
-
-        # Keywords for classification
-        patterns = {
-            MeetingCategory.STATUS_UPDATE: r"(status|standup|stand-up|sync|check-in|check in|weekly|daily)",
-            MeetingCategory.PLANNING: r"(planning|plan|roadmap|sprint|backlog|quarterly)",
-            MeetingCategory.REVIEW: r"(review|retrospective|retro|post-mortem|postmortem|feedback)",
-            MeetingCategory.BRAINSTORM: r"(brainstorm|ideation|workshop|design thinking|whiteboard)",
-            MeetingCategory.DECISION: r"(decision|approve|approval|sign-off|signoff|go/no-go)",
-            MeetingCategory.TRAINING: r"(training|onboarding|learning|tutorial|demo|demonstration)",
-            MeetingCategory.SOCIAL: r"(happy hour|team building|celebration|birthday|farewell|lunch|coffee)",
-            MeetingCategory.CLIENT_MEETING: r"(client|customer|sales call|pitch|proposal|demo)",
-            MeetingCategory.INTERVIEW: r"(interview|hiring|candidate|recruitment)",
-            MeetingCategory.PERFORMANCE: r"(performance|1:1|one-on-one|career|growth|development)",
-            MeetingCategory.PROJECT: r"(project|kickoff|kick-off|milestone|deliverable)",
-            MeetingCategory.OPERATIONAL: r"(ops|operational|incident|outage|on-call|support)",
-            MeetingCategory.STRATEGIC: r"(strategy|strategic|vision|leadership|exec|board)",
-        }
-
-        for category, pattern in patterns.items():
-            if re.search(pattern, text):
-                return category
-
-        return MeetingCategory.OTHER
+        return classify_meeting_text(f"{self.subject} {self.body}")
 
     def get_attendee_emails(self) -> list[str]:
         """Get list of all attendee emails including organizer."""
@@ -224,21 +268,18 @@ class CalendarEvent:
 
     def has_attendee(self, email: str) -> bool:
         """Check if a specific email is an attendee."""
-        return email.lower() in [e.lower() for e in self.get_attendee_emails()]
+        return email.lower() in self.get_attendee_emails()
 
     def is_organizer(self, email: str) -> bool:
         """Check if email is the organizer."""
-        return self.organizer_email.lower() == email.lower()
+        return self.organizer_email == email.lower()
 
     def get_response_rate(self) -> float:
         """Calculate response rate (accepted + declined / total)."""
         if not self.attendees:
             return 1.0
 
-        responded = sum(1 for a in self.attendees
-                       if a.response in [AttendeeResponse.ACCEPTED,
-                                         AttendeeResponse.DECLINED,
-                                         AttendeeResponse.TENTATIVE])
+        responded = sum(1 for a in self.attendees if a.response in _RESPONDED)
         return responded / len(self.attendees)
 
     def get_acceptance_rate(self) -> float:
@@ -1,7 +1,8 @@
 """Employee and organization data models for HRIS integration."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import NamedTuple, Optional
 from enum import Enum
 
 
@@ -19,6 +20,27 @@ class JobLevel(Enum):
     C_LEVEL = "C-Level"
     UNKNOWN = "Unknown"
 
+    # Members are singletons, so identity hashing is consistent with the
+    # identity equality Enum already uses and avoids Enum's Python-level
+    # __hash__ on every dict or set lookup
+    __hash__ = object.__hash__
+
+
+# Numeric rank of each level, for Employee.get_level_numeric
+_LEVEL_NUMERIC = {
+    JobLevel.INDIVIDUAL_CONTRIBUTOR: 1,
+    JobLevel.SENIOR_IC: 2,
+    JobLevel.LEAD: 3,
+    JobLevel.MANAGER: 4,
+    JobLevel.SENIOR_MANAGER: 5,
+    JobLevel.DIRECTOR: 6,
+    JobLevel.SENIOR_DIRECTOR: 7,
+    JobLevel.VP: 8,
+    JobLevel.SVP: 9,
+    JobLevel.C_LEVEL: 10,
+    JobLevel.UNKNOWN: 0,
+}
+
 
 class JobFunction(Enum):
     """Job function categories."""
@@ -38,10 +60,19 @@ class JobFunction(Enum):
     ADMIN = "Admin"
     OTHER = "Other"
 
+    # Identity hashing, as for JobLevel
+    __hash__ = object.__hash__
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class Employee:
-    """Represents an employee from HRIS data."""
+    """
+    Represents an employee from HRIS data.
+
+    Employees are identified by their (lowercased) email: equality and
+    hashing use only that field, so reassigning ``email`` on an employee
+    held in a set or dict key invalidates its hash.
+    """
 
     employee_id: str
     email: str
@@ -63,9 +94,19 @@ class Employee:
     company_domain: str = ""
 
     def __post_init__(self):
-        """Extract company domain from email if not provided."""
-        if not self.company_domain and "@" in self.email:
-            self.company_domain = self.email.split("@")[1].lower()
+        """Normalize emails and extract company domain if not provided."""
+        # Emails are compared case-insensitively; lowercase them once here.
+        # Many employees share a manager, so manager emails are interned
+        self.email = self.email.lower()
+        if self.manager_email:
+            self.manager_email = sys.intern(self.manager_email.lower())
+        if self.skip_level_manager_email:
+            self.skip_level_manager_email = sys.intern(self.skip_level_manager_email.lower())
+
+        if not self.company_domain:
+            _, at, domain = self.email.partition("@")
+            if at:
+                self.company_domain = domain
 
     @property
     def direct_report_count(self) -> int:
@@ -102,34 +143,29 @@ class Employee:
 
     def reports_to(self, other: "Employee") -> bool:
         """Check if this employee reports to other."""
-        return self.manager_email and self.manager_email.lower() == other.email.lower()
+        return self.manager_email and self.manager_email == other.email
 
     def is_skip_level_of(self, other: "Employee") -> bool:
         """Check if this employee is skip-level manager of other."""
-        return other.skip_level_manager_email and other.skip_level_manager_email.lower() == self.email.lower()
+        return other.skip_level_manager_email and other.skip_level_manager_email == self.email
 
     def get_level_numeric(self) -> int:
         """Get numeric level for comparison."""
-        level_map = {
-            JobLevel.INDIVIDUAL_CONTRIBUTOR: 1,
-            JobLevel.SENIOR_IC: 2,
-            JobLevel.LEAD: 3,
-            JobLevel.MANAGER: 4,
-            JobLevel.SENIOR_MANAGER: 5,
-            JobLevel.DIRECTOR: 6,
-            JobLevel.SENIOR_DIRECTOR: 7,
-            JobLevel.VP: 8,
-            JobLevel.SVP: 9,
-            JobLevel.C_LEVEL: 10,
-            JobLevel.UNKNOWN: 0,
-        }
-        return level_map.get(self.job_level, 0)
+        return _LEVEL_NUMERIC.get(self.job_level, 0)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Employee):
+            return NotImplemented
+        return self.email == other.email
+
+    def __hash__(self) -> int:
+        return hash(self.email)
 
     def __repr__(self) -> str:
         return f"Employee(name='{self.name}', email='{self.email}', title='{self.job_title}')"
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """Represents a team within the organization."""
 
@@ -147,18 +183,65 @@ class Team:
         return len(self.members) + 1
 
 
-@dataclass
+class _OrgIndex(NamedTuple):
+    """Employees bucketed by the attributes Organization queries on."""
+    by_manager: dict[str, list[Employee]]  # manager email -> reports
+    by_team: dict[str, list[Employee]]
+    by_function: dict[JobFunction, list[Employee]]
+    by_level: dict[JobLevel, list[Employee]]
+
+
+@dataclass(slots=True)
 class Organization:
-    """Represents the organizational structure."""
+    """
+    Represents the organizational structure.
+
+    Manager, team, function and level queries read an index of employees
+    that is rebuilt after add_employee. Call invalidate_index after
+    changing an added employee's manager_email, team, job_function or
+    job_level, or after adding, replacing or removing entries in
+    ``employees`` directly.
+    """
 
     company_name: str
     domain: str
     employees: dict[str, Employee] = field(default_factory=dict)  # email -> Employee
     teams: dict[str, Team] = field(default_factory=dict)  # team_id -> Team
+    _index: Optional[_OrgIndex] = field(default=None, init=False, repr=False, compare=False)
 
     def add_employee(self, employee: Employee) -> None:
         """Add an employee to the organization."""
-        self.employees[employee.email.lower()] = employee
+        self.employees[employee.email] = employee
+        self._index = None
+
+    def invalidate_index(self) -> None:
+        """Rebuild the employee lookup index on the next query."""
+        self._index = None
+
+    def _get_index(self) -> _OrgIndex:
+        """
+        Get the employee lookup index, building it on first use.
+
+        The index is rebuilt after add_employee or invalidate_index, so
+        queries after loading are dict lookups instead of scans. Buckets keep employees in dict order, like
+        the scans did.
+        """
+        if self._index is not None:
+            return self._index
+
+        by_manager: dict[str, list[Employee]] = {}
+        by_team: dict[str, list[Employee]] = {}
+        by_function: dict[JobFunction, list[Employee]] = {}
+        by_level: dict[JobLevel, list[Employee]] = {}
+        for emp in self.employees.values():
+            if emp.manager_email:
+                by_manager.setdefault(emp.manager_email, []).append(emp)
+            by_team.setdefault(emp.team, []).append(emp)
+            by_function.setdefault(emp.job_function, []).append(emp)
+            by_level.setdefault(emp.job_level, []).append(emp)
+
+        self._index = _OrgIndex(by_manager, by_team, by_function, by_level)
+        return self._index
 
     def get_employee(self, email: str) -> Optional[Employee]:
         """Get employee by email."""
@@ -182,53 +265,106 @@ class Organization:
 
     def get_direct_reports(self, manager_email: str) -> list[Employee]:
         """Get all direct reports of a manager."""
-        return [emp for emp in self.employees.values()
-                if emp.manager_email and emp.manager_email.lower() == manager_email.lower()]
+        return list(self._get_index().by_manager.get(manager_email.lower(), ()))
 
     def get_team_members(self, employee: Employee) -> list[Employee]:
         """Get all members of the same team."""
-        return [emp for emp in self.employees.values()
-                if emp.team == employee.team and emp.email != employee.email]
+        return [emp for emp in self._get_index().by_team.get(employee.team, ())
+                if emp.email != employee.email]
 
     def get_employees_by_function(self, function: JobFunction) -> list[Employee]:
         """Get all employees in a job function."""
-        return [emp for emp in self.employees.values()
-                if emp.job_function == function]
+        return list(self._get_index().by_function.get(function, ()))
 
     def get_employees_by_level(self, level: JobLevel) -> list[Employee]:
         """Get all employees at a job level."""
-        return [emp for emp in self.employees.values()
-                if emp.job_level == level]
+        return list(self._get_index().by_level.get(level, ()))
 
     def get_all_managers(self) -> list[Employee]:
         """Get all employees who are managers."""
+        # Not indexed: is_people_manager changes as direct reports are added
         return [emp for emp in self.employees.values()
                 if emp.is_people_manager]
 
     def is_internal_email(self, email: str) -> bool:
         """Check if an email belongs to the organization."""
-        if "@" not in email:
-            return False
-        email_domain = email.split("@")[1].lower()
-        return email_domain == self.domain.lower()
+        _, at, email_domain = email.partition("@")
+        return bool(at) and email_domain.lower() == self.domain.lower()
 
     def get_reporting_chain(self, employee: Employee) -> list[Employee]:
         """Get the full reporting chain up to the top."""
         chain = []
+        # Emails already in the chain, so a reporting cycle stops the walk
+        visited: set[str] = set()
         current = employee
         while current.manager_email:
             manager = self.get_employee(current.manager_email)
-            if manager and manager not in chain:
-                chain.append(manager)
-                current = manager
-            else:
+            if manager is None or manager.email in visited:
                 break
+            chain.append(manager)
+            visited.add(manager.email)
+            current = manager
         return chain
 
     def get_org_depth(self, employee: Employee) -> int:
         """Get the organizational depth of an employee."""
         return len(self.get_reporting_chain(employee))
 
+    def compute_all_depths(self) -> dict[str, int]:
+        """
+        Get the organizational depth of every employee in one pass.
+
+        Equivalent to calling get_org_depth for each employee, but each
+        manager's depth is computed once and reused by everyone below them.
+
+        Returns:
+            Dictionary mapping employee email to depth
+        """
+        depths: dict[str, int] = {}
+        # Employees on a reporting cycle: their depth already counts themselves
+        on_cycle: set[str] = set()
+
+        for employee in self.employees.values():
+            if employee.email in depths:
+                continue
+
+            # Walk up until reaching the top, a known depth, or a cycle
+            path: list[str] = []
+            position: dict[str, int] = {}
+            depth, above_on_cycle = 0, False
+            current = employee
+            while True:
+                position[current.email] = len(path)
+                path.append(current.email)
+                manager = self.get_manager(current)
+                if manager is None:
+                    depths[path.pop()] = 0
+                    break
+                if manager.email in depths:
+                    depth = depths[manager.email]
+                    above_on_cycle = manager.email in on_cycle
+                    break
+                if manager.email in position:
+                    # Everyone on a cycle reaches all of its members
+                    start = position[manager.email]
+                    cycle = path[start:]
+                    del path[start:]
+                    for email in cycle:
+                        depths[email] = len(cycle)
+                    on_cycle.update(cycle)
+                    depth, above_on_cycle = len(cycle), True
+                    break
+                current = manager
+
+            # Resolve the rest of the path, nearest the top first
+            for email in reversed(path):
+                if not above_on_cycle:
+                    depth += 1
+                above_on_cycle = False
+                depths[email] = depth
+
+        return depths
+
     @property
     def employee_count(self) -> int:
         """Total number of employees."""
@@ -237,21 +373,17 @@ class Organization:
     @property
     def manager_count(self) -> int:
         """Total number of managers."""
-        return len(self.get_all_managers())
+        # Counted on demand rather than kept in add_employee: direct reports
+        # are usually linked after employees are added
+        return sum(1 for emp in self.employees.values() if emp.is_people_manager)
 
     def get_function_breakdown(self) -> dict[JobFunction, int]:
         """Get count of employees by function."""
-        breakdown: dict[JobFunction, int] = {}
-        for emp in self.employees.values():
-            breakdown[emp.job_function] = breakdown.get(emp.job_function, 0) + 1
-        return breakdown
+        return {function: len(emps) for function, emps in self._get_index().by_function.items()}
 
     def get_level_breakdown(self) -> dict[JobLevel, int]:
         """Get count of employees by level."""
-        breakdown: dict[JobLevel, int] = {}
-        for emp in self.employees.values():
-            breakdown[emp.job_level] = breakdown.get(emp.job_level, 0) + 1
-        return breakdown
+        return {level: len(emps) for level, emps in self._get_index().by_level.items()}
 
     def __repr__(self) -> str:
         return f"Organization(name='{self.company_name}', employees={self.employee_count})"
@@ -1,8 +1,140 @@
 """Report generation utilities for calendar analytics."""
 
 import json
+import re
 from datetime import datetime
-from typing import Optional
+from io import StringIO
+from typing import IO, Optional
+
+try:
+    import orjson
+except ImportError:  # optional faster JSON serializer
+    orjson = None
+
+
+# Markdown patterns for ReportGenerator._md_to_html, compiled once
+_HEADER_RE = re.compile(r'^(#{1,3}) (.+)$', re.MULTILINE)
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.+?)\*')
+_LIST_RE = re.compile(r'^- (.+)$', re.MULTILINE)
+
+
+# Static parts of the HTML report page, around the title and the body
+_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>"""
+
+_HTML_MID = """</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            line-height: 1.6;
+            color: #333;
+        }
+        h1 { color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }
+        h2 { color: #2980b9; margin-top: 30px; }
+        h3 { color: #27ae60; }
+        table {
+            border-collapse: collapse;
+            width: 100%;
+            margin: 20px 0;
+        }
+        th, td {
+            border: 1px solid #ddd;
+            padding: 12px;
+            text-align: left;
+        }
+        th {
+            background-color: #3498db;
+            color: white;
+        }
+        tr:nth-child(even) { background-color: #f9f9f9; }
+        tr:hover { background-color: #f5f5f5; }
+        .metric { font-size: 24px; font-weight: bold; color: #2c3e50; }
+        .card {
+            background: #f8f9fa;
+            border-radius: 8px;
+            padding: 20px;
+            margin: 10px 0;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        code { background: #f4f4f4; padding: 2px 6px; border-radius: 4px; }
+    </style>
+</head>
+<body>
+    <article>
+        """
+
+_HTML_TAIL = """
+    </article>
+</body>
+</html>"""
+
+
+# Executive summary KEY METRICS rows: (label, summary key, format spec, suffix)
+_SUMMARY_METRICS = (
+    ("Total Meetings:", "total_meetings", "", ""),
+    ("Total Hours:", "total_hours", ".1f", ""),
+    ("Avg Meetings/Day:", "avg_meetings_per_day", ".1f", ""),
+    ("Avg Hours/Day:", "avg_hours_per_day", ".1f", ""),
+    ("Avg Meeting Duration:", "avg_meeting_duration_minutes", ".0f", " min"),
+    ("Avg Attendees:", "avg_attendees", ".1f", ""),
+    ("Recurring Meetings:", "recurring_percentage", ".1f", "%"),
+    ("External Meetings:", "external_percentage", ".1f", "%"),
+)
+
+
+def format_metric(value, spec: str = ".1f", width: int = 0) -> str:
+    """
+    Format a metric that may be missing.
+
+    Numbers are formatted with ``spec``; anything else (such as the "N/A"
+    placeholder) is shown as-is instead of raising on the float spec.
+    Both are right-aligned to ``width``.
+    """
+    if isinstance(value, (int, float)):
+        return format(value, spec).rjust(width)
+    return str(value).rjust(width)
+
+
+def _orjson_dumps(insights: dict, pretty: bool = True) -> Optional[bytes]:
+    """
+    Serialize insights with orjson when it is installed.
+
+    Datetimes and dataclasses are passed through to ``default=str`` as on
+    the stdlib path. The result is equivalent JSON, but not byte-identical
+    to json.dumps(..., default=str):
+
+    - non-ASCII characters are written as UTF-8 instead of \\u escapes
+    - NaN and infinity are written as null (json.dumps writes NaN/Infinity,
+      which is not valid JSON)
+    - Enum members are written as their value instead of str(member)
+    - compact output has no space after "," and ":"
+
+    Returns None when orjson is missing or cannot encode the data, in which
+    case callers fall back to json.dumps.
+    """
+    if orjson is None:
+        return None
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(insights, default=str, option=option)
+    except orjson.JSONEncodeError:
+        return None
+
+
+def _header_to_html(match: re.Match) -> str:
+    """Render a matched "#", "##" or "###" header line as h1-h3."""
+    level = len(match[1])
+    return f'<h{level}>{match[2]}</h{level}>'
 
 
 class ReportGenerator:
@@ -43,16 +175,12 @@ class ReportGenerator:
             "",
             "KEY METRICS",
             "-" * 40,
-            f"Total Meetings:          {summary.get('total_meetings', 'N/A'):>10}",
-            f"Total Hours:             {summary.get('total_hours', 'N/A'):>10.1f}",
-            f"Avg Meetings/Day:        {summary.get('avg_meetings_per_day', 'N/A'):>10.1f}",
-            f"Avg Hours/Day:           {summary.get('avg_hours_per_day', 'N/A'):>10.1f}",
-            f"Avg Meeting Duration:    {summary.get('avg_meeting_duration_minutes', 'N/A'):>10.0f} min",
-            f"Avg Attendees:           {summary.get('avg_attendees', 'N/A'):>10.1f}",
-            f"Recurring Meetings:      {summary.get('recurring_percentage', 'N/A'):>10.1f}%",
-            f"External Meetings:       {summary.get('external_percentage', 'N/A'):>10.1f}%",
-            "",
         ]
+        lines.extend(
+            f"{label:<25}{format_metric(summary.get(key, 'N/A'), spec, 10)}{suffix}"
+            for label, key, spec, suffix in _SUMMARY_METRICS
+        )
+        lines.append("")
 
         # High priority issues
         high_priority = best_practices.get("high_priority", [])
@@ -81,56 +209,68 @@ class ReportGenerator:
 
         return "\n".join(lines)
 
-    def generate_markdown_report(self, insights: dict, title: str = "Calendar Analytics Report") -> str:
+    def generate_markdown_report(
+        self,
+        insights: dict,
+        title: str = "Calendar Analytics Report",
+        out: Optional[IO[str]] = None
+    ) -> Optional[str]:
         """
         Generate a comprehensive markdown report.
 
         Args:
             insights: Full insights dictionary
             title: Report title
+            out: Optional text stream to write the report to line by line;
+                the streamed text ends with a newline
 
         Returns:
-            Markdown formatted report
+            Markdown formatted report, or None when written to ``out``
         """
-        md = []
+        buffer = StringIO() if out is None else None
+        write = (out or buffer).write
+
+        def emit(line: str) -> None:
+            write(line)
+            write("\n")
 
         # Header
-        md.append(f"# {title}")
-        md.append(f"\n*Generated: {self.generated_at.strftime('%Y-%m-%d %H:%M')}*\n")
+        emit(f"# {title}")
+        emit(f"\n*Generated: {self.generated_at.strftime('%Y-%m-%d %H:%M')}*\n")
 
         # Table of Contents
-        md.append("## Table of Contents")
-        md.append("1. [Executive Summary](#executive-summary)")
-        md.append("2. [Meeting Size & Duration](#meeting-size--duration)")
-        md.append("3. [Meeting Types](#meeting-types)")
-        md.append("4. [Time Patterns](#time-patterns)")
-        md.append("5. [Cross-Functional Collaboration](#cross-functional-collaboration)")
-        md.append("6. [Recommendations](#recommendations)")
-        md.append("")
+        emit("## Table of Contents")
+        emit("1. [Executive Summary](#executive-summary)")
+        emit("2. [Meeting Size & Duration](#meeting-size--duration)")
+        emit("3. [Meeting Types](#meeting-types)")
+        emit("4. [Time Patterns](#time-patterns)")
+        emit("5. [Cross-Functional Collaboration](#cross-functional-collaboration)")
+        emit("6. [Recommendations](#recommendations)")
+        emit("")
 
         # Executive Summary
-        md.append("## Executive Summary\n")
+        emit("## Executive Summary\n")
         summary = insights.get("summary", {})
-        md.append("| Metric | Value |")
-        md.append("|--------|-------|")
-        md.append(f"| Total Meetings | {summary.get('total_meetings', 'N/A')} |")
-        md.append(f"| Total Hours | {summary.get('total_hours', 'N/A'):.1f} |")
-        md.append(f"| Days Analyzed | {summary.get('unique_days_analyzed', 'N/A')} |")
-        md.append(f"| Avg Meetings/Day | {summary.get('avg_meetings_per_day', 'N/A'):.1f} |")
-        md.append(f"| Avg Hours/Day | {summary.get('avg_hours_per_day', 'N/A'):.1f} |")
-        md.append(f"| Avg Duration | {summary.get('avg_meeting_duration_minutes', 'N/A'):.0f} min |")
-        md.append(f"| Recurring % | {summary.get('recurring_percentage', 'N/A'):.1f}% |")
-        md.append(f"| External % | {summary.get('external_percentage', 'N/A'):.1f}% |")
-        md.append("")
+        emit("| Metric | Value |")
+        emit("|--------|-------|")
+        emit(f"| Total Meetings | {summary.get('total_meetings', 'N/A')} |")
+        emit(f"| Total Hours | {format_metric(summary.get('total_hours', 'N/A'), '.1f')} |")
+        emit(f"| Days Analyzed | {summary.get('unique_days_analyzed', 'N/A')} |")
+        emit(f"| Avg Meetings/Day | {format_metric(summary.get('avg_meetings_per_day', 'N/A'), '.1f')} |")
+        emit(f"| Avg Hours/Day | {format_metric(summary.get('avg_hours_per_day', 'N/A'), '.1f')} |")
+        emit(f"| Avg Duration | {format_metric(summary.get('avg_meeting_duration_minutes', 'N/A'), '.0f')} min |")
+        emit(f"| Recurring % | {format_metric(summary.get('recurring_percentage', 'N/A'), '.1f')}% |")
+        emit(f"| External % | {format_metric(summary.get('external_percentage', 'N/A'), '.1f')}% |")
+        emit("")
 
         # Size & Duration Matrix
-        md.append("## Meeting Size & Duration\n")
-        md.append("### 3x3 Matrix (Count / Hours)\n")
+        emit("## Meeting Size & Duration\n")
+        emit("### 3x3 Matrix (Count / Hours)\n")
 
         matrix = insights.get("size_duration_matrix", {}).get("matrix", {})
         if matrix:
-            md.append("| Size \\ Duration | Short (≤30m) | Medium (31-60m) | Long (>60m) |")
-            md.append("|-----------------|--------------|-----------------|-------------|")
+            emit("| Size \\ Duration | Short (≤30m) | Medium (31-60m) | Long (>60m) |")
+            emit("|-----------------|--------------|-----------------|-------------|")
 
             for size in ["small", "medium", "large"]:
                 size_data = matrix.get(size, {})
@@ -138,114 +278,117 @@ class ReportGenerator:
                 medium = size_data.get("medium", {})
                 long = size_data.get("long", {})
 
-                md.append(
+                emit(
                     f"| {size.capitalize()} | "
                     f"{short.get('count', 0)} ({short.get('hours', 0):.1f}h) | "
                     f"{medium.get('count', 0)} ({medium.get('hours', 0):.1f}h) | "
                     f"{long.get('count', 0)} ({long.get('hours', 0):.1f}h) |"
                 )
-            md.append("")
+            emit("")
 
         # Meeting Types
-        md.append("## Meeting Types\n")
-        md.append("### 1:1 vs Team Meetings\n")
+        emit("## Meeting Types\n")
+        emit("### 1:1 vs Team Meetings\n")
 
         one_on_one = insights.get("one_on_one_vs_team", {})
         if one_on_one:
-            md.append("| Type | Count | Hours | % of Meetings | % of Time |")
-            md.append("|------|-------|-------|---------------|-----------|")
+            emit("| Type | Count | Hours | % of Meetings | % of Time |")
+            emit("|------|-------|-------|---------------|-----------|")
 
             for mtype, data in one_on_one.items():
-                md.append(
+                emit(
                     f"| {mtype} | {data.get('count', 0)} | "
                     f"{data.get('hours', 0):.1f} | "
                     f"{data.get('percentage_of_meetings', 0):.1f}% | "
                     f"{data.get('percentage_of_time', 0):.1f}% |"
                 )
-            md.append("")
+            emit("")
 
         # Recurring vs Ad-hoc
-        md.append("### Recurring vs Ad-hoc\n")
+        emit("### Recurring vs Ad-hoc\n")
         recurring = insights.get("recurring_vs_adhoc", {})
         if recurring:
             rec = recurring.get("recurring", {})
             adhoc = recurring.get("adhoc", {})
 
-            md.append("| Type | Count | Hours | Avg Duration | Avg Attendees |")
-            md.append("|------|-------|-------|--------------|---------------|")
-            md.append(
+            emit("| Type | Count | Hours | Avg Duration | Avg Attendees |")
+            emit("|------|-------|-------|--------------|---------------|")
+            emit(
                 f"| Recurring | {rec.get('count', 0)} | "
                 f"{rec.get('hours', 0):.1f} | "
                 f"{rec.get('avg_duration_minutes', 0):.0f} min | "
                 f"{rec.get('avg_attendees', 0):.1f} |"
             )
-            md.append(
+            emit(
                 f"| Ad-hoc | {adhoc.get('count', 0)} | "
                 f"{adhoc.get('hours', 0):.1f} | "
                 f"{adhoc.get('avg_duration_minutes', 0):.0f} min | "
                 f"{adhoc.get('avg_attendees', 0):.1f} |"
             )
-            md.append("")
+            emit("")
 
         # Time Patterns
-        md.append("## Time Patterns\n")
+        emit("## Time Patterns\n")
         timing = insights.get("timing_analysis", {})
         if timing:
-            md.append(f"**Busiest Day:** {timing.get('busiest_day', 'N/A')}\n")
-            md.append(f"**Peak Hour:** {timing.get('busiest_hour', 'N/A')}\n")
+            emit(f"**Busiest Day:** {timing.get('busiest_day', 'N/A')}\n")
+            emit(f"**Peak Hour:** {timing.get('busiest_hour', 'N/A')}\n")
 
             early = timing.get("early_morning_meetings", {})
             late = timing.get("late_evening_meetings", {})
             lunch = timing.get("lunch_time_meetings", {})
 
-            md.append("\n| Time Period | Meetings | Hours |")
-            md.append("|-------------|----------|-------|")
-            md.append(f"| Early Morning (<9am) | {early.get('count', 0)} | {early.get('hours', 0):.1f} |")
-            md.append(f"| Lunch Time (12-1pm) | {lunch.get('count', 0)} | {lunch.get('hours', 0):.1f} |")
-            md.append(f"| Late Evening (>6pm) | {late.get('count', 0)} | {late.get('hours', 0):.1f} |")
-            md.append("")
+            emit("\n| Time Period | Meetings | Hours |")
+            emit("|-------------|----------|-------|")
+            emit(f"| Early Morning (<9am) | {early.get('count', 0)} | {early.get('hours', 0):.1f} |")
+            emit(f"| Lunch Time (12-1pm) | {lunch.get('count', 0)} | {lunch.get('hours', 0):.1f} |")
+            emit(f"| Late Evening (>6pm) | {late.get('count', 0)} | {late.get('hours', 0):.1f} |")
+            emit("")
 
         # Cross-Functional
-        md.append("## Cross-Functional Collaboration\n")
+        emit("## Cross-Functional Collaboration\n")
         cf = insights.get("cross_functional_health", {})
         if cf:
-            md.append(f"**Health Score:** {cf.get('health_score', 0):.0f}/100 ({cf.get('health_rating', 'N/A')})\n")
-            md.append(f"**Cross-Functional Meetings:** {cf.get('cross_functional_percentage', 0):.1f}%\n")
+            emit(f"**Health Score:** {cf.get('health_score', 0):.0f}/100 ({cf.get('health_rating', 'N/A')})\n")
+            emit(f"**Cross-Functional Meetings:** {cf.get('cross_functional_percentage', 0):.1f}%\n")
 
             if cf.get("strongest_connections"):
-                md.append("\n### Strongest Connections\n")
+                emit("\n### Strongest Connections\n")
                 for conn in cf["strongest_connections"][:3]:
-                    md.append(f"- {conn.get('function_a', '')} ↔ {conn.get('function_b', '')}: {conn.get('meeting_count', 0)} meetings")
-                md.append("")
+                    emit(f"- {conn.get('function_a', '')} ↔ {conn.get('function_b', '')}: {conn.get('meeting_count', 0)} meetings")
+                emit("")
 
         # Recommendations
-        md.append("## Recommendations\n")
+        emit("## Recommendations\n")
         bp = insights.get("best_practices", {})
 
         if bp.get("high_priority"):
-            md.append("### 🔴 High Priority\n")
+            emit("### 🔴 High Priority\n")
             for rec in bp["high_priority"]:
-                md.append(f"**{rec['issue']}**")
-                md.append(f"- *Finding:* {rec['finding']}")
-                md.append(f"- *Recommendation:* {rec['recommendation']}")
-                md.append(f"- *Impact:* {rec['impact']}")
-                md.append("")
+                emit(f"**{rec['issue']}**")
+                emit(f"- *Finding:* {rec['finding']}")
+                emit(f"- *Recommendation:* {rec['recommendation']}")
+                emit(f"- *Impact:* {rec['impact']}")
+                emit("")
 
         if bp.get("medium_priority"):
-            md.append("### 🟡 Medium Priority\n")
+            emit("### 🟡 Medium Priority\n")
             for rec in bp["medium_priority"]:
-                md.append(f"**{rec['issue']}**")
-                md.append(f"- *Finding:* {rec['finding']}")
-                md.append(f"- *Recommendation:* {rec['recommendation']}")
-                md.append("")
+                emit(f"**{rec['issue']}**")
+                emit(f"- *Finding:* {rec['finding']}")
+                emit(f"- *Recommendation:* {rec['recommendation']}")
+                emit("")
 
         if bp.get("positive_patterns"):
-            md.append("### 🟢 Positive Patterns\n")
+            emit("### 🟢 Positive Patterns\n")
             for pattern in bp["positive_patterns"]:
-                md.append(f"- **{pattern['pattern']}**: {pattern['finding']}")
-            md.append("")
+                emit(f"- **{pattern['pattern']}**: {pattern['finding']}")
+            emit("")
 
-        return "\n".join(md)
+        if buffer is not None:
+            # Lines are joined by newlines, with none after the last one
+            return buffer.getvalue()[:-1]
+        return None
 
     def generate_html_report(self, insights: dict, title: str = "Calendar Analytics Report") -> str:
         """
@@ -261,93 +404,45 @@ class ReportGenerator:
         md_content = self.generate_markdown_report(insights, title)
 
         # Simple HTML wrapper with styling
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>{title}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            line-height: 1.6;
-            color: #333;
-        }}
-        h1 {{ color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }}
-        h2 {{ color: #2980b9; margin-top: 30px; }}
-        h3 {{ color: #27ae60; }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 20px 0;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 12px;
-            text-align: left;
-        }}
-        th {{
-            background-color: #3498db;
-            color: white;
-        }}
-        tr:nth-child(even) {{ background-color: #f9f9f9; }}
-        tr:hover {{ background-color: #f5f5f5; }}
-        .metric {{ font-size: 24px; font-weight: bold; color: #2c3e50; }}
-        .card {{
-            background: #f8f9fa;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 10px 0;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        code {{ background: #f4f4f4; padding: 2px 6px; border-radius: 4px; }}
-    </style>
-</head>
-<body>
-    <article>
-        {self._md_to_html(md_content)}
-    </article>
-</body>
-</html>"""
+        html = "".join((_HTML_HEAD, title, _HTML_MID, self._md_to_html(md_content), _HTML_TAIL))
 
         return html
 
     def _md_to_html(self, markdown: str) -> str:
         """Simple markdown to HTML conversion."""
-        import re
-
-        html = markdown
-
-        # Headers
-        html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-        html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-        html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
+        in_table = False
+        result = []
 
-        # Bold and italic
-        html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-        html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
+        # Markup never spans lines, so each line is converted in one pass;
+        # prefix checks skip the patterns that cannot match
+        for line in markdown.split('\n'):
+            # Headers
+            if line.startswith('#'):
+                line = _HEADER_RE.sub(_header_to_html, line)
 
-        # Lists
-        html = re.sub(r'^- (.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
+            # Bold and italic
+            if '*' in line:
+                line = _BOLD_RE.sub(r'<strong>\1</strong>', line)
+                line = _ITALIC_RE.sub(r'<em>\1</em>', line)
 
-        # Tables (simple conversion)
-        lines = html.split('\n')
-        in_table = False
-        result = []
+            # Lists
+            if line.startswith('- '):
+                line = _LIST_RE.sub(r'<li>\1</li>', line)
 
-        for line in lines:
+            # Tables (simple conversion)
             if '|' in line and not line.startswith('|--'):
+                # The first row of a table is its header
+                tag = 'td' if in_table else 'th'
                 if not in_table:
                     result.append('<table>')
                     in_table = True
 
-                cells = [c.strip() for c in line.split('|')[1:-1]]
-                if result[-1] == '<table>':
-                    result.append('<tr>' + ''.join(f'<th>{c}</th>' for c in cells) + '</tr>')
-                else:
-                    result.append('<tr>' + ''.join(f'<td>{c}</td>' for c in cells) + '</tr>')
+                cells = line.split('|')[1:-1]
+                result.append(''.join((
+                    '<tr>',
+                    *(f'<{tag}>{c.strip()}</{tag}>' for c in cells),
+                    '</tr>',
+                )))
             elif '|--' in line:
                 continue  # Skip table separator
             else:
@@ -362,7 +457,7 @@ class ReportGenerator:
         html = '\n'.join(result)
 
         # Paragraphs
-        html = re.sub(r'\n\n', '</p><p>', html)
+        html = html.replace('\n\n', '</p><p>')
         html = f'<p>{html}</p>'
 
         return html
@@ -378,6 +473,10 @@ class ReportGenerator:
         Returns:
             JSON string
         """
+        data = _orjson_dumps(insights, pretty)
+        if data is not None:
+            return data.decode("utf-8")
+
         if pretty:
             return json.dumps(insights, indent=2, default=str)
         return json.dumps(insights, default=str)
@@ -396,16 +495,20 @@ class ReportGenerator:
             output_path: Path to save the report
             format: Output format (markdown, html, json, text)
         """
-        if format == "markdown":
-            content = self.generate_markdown_report(insights)
-        elif format == "html":
-            content = self.generate_html_report(insights)
-        elif format == "json":
-            content = self.generate_json_report(insights)
-        else:  # text
-            content = self.generate_executive_summary(insights)
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        if format == "json" and (data := _orjson_dumps(insights)) is not None:
+            # orjson output is already UTF-8; write it without a decode/encode round trip
+            with open(output_path, "wb") as f:
+                f.write(data)
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                if format == "markdown":
+                    # Streamed straight to disk rather than built in memory first
+                    self.generate_markdown_report(insights, out=f)
+                elif format == "html":
+                    f.write(self.generate_html_report(insights))
+                elif format == "json":
+                    f.write(self.generate_json_report(insights))
+                else:  # text
+                    f.write(self.generate_executive_summary(insights))
 
         print(f"Report saved to: {output_path}")
@@ -2,13 +2,131 @@
 
 import random
 from datetime import datetime, timedelta
-from typing import Optional
+from itertools import accumulate, count
+from typing import IO, Iterable, Optional
 import json
 
+try:
+    import orjson
+except ImportError:  # optional faster JSON serializer
+    orjson = None
+
 from ..models.calendar_event import CalendarEvent, Attendee, AttendeeResponse
 from ..models.employee import Employee, Organization, JobLevel, JobFunction
 
 
+def _event_to_dict(event: CalendarEvent) -> dict:
+    """Convert a generated event to the JSON shape written by export_sample_data."""
+    return {
+        "event_id": event.event_id,
+        "subject": event.subject,
+        "organizer_email": event.organizer_email,
+        "start_time": event.start_time.isoformat(),
+        "end_time": event.end_time.isoformat(),
+        "attendees": [
+            {
+                "email": a.email,
+                "name": a.name,
+                "response": a.response.value,
+                "is_required": a.is_required,
+                "is_external": a.is_external,
+            }
+            for a in event.attendees
+        ],
+        "is_recurring": event.is_recurring,
+        "recurrence_pattern": event.recurrence_pattern,
+        "importance": event.importance,
+    }
+
+
+def _dumps(data, pretty: bool = False) -> str:
+    """
+    Serialize data to JSON text, with orjson when it is installed.
+
+    Output is the same either way: indent=2 when pretty, otherwise compact
+    separators, with non-ASCII characters escaped as json.dumps does.
+    """
+    if orjson is not None:
+        text = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0).decode("utf-8")
+        # orjson cannot escape non-ASCII; such (rare) data goes through json
+        if text.isascii():
+            return text
+    if pretty:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _calendar_filename(email: str) -> str:
+    """Get the calendar file name export_sample_data uses for an email."""
+    safe_email = email.replace("@", "_at_").replace(".", "_")
+    return f"{safe_email}.json"
+
+
+def _write_json_array(f: IO[str], items: Iterable[dict], pretty: bool = False) -> None:
+    """
+    Write items to f as a JSON array, one element at a time.
+
+    Produces the same array as json.dump(list(items), f) without holding
+    the whole array in memory; pretty output matches indent=2.
+    """
+    f.write("[")
+    first = True
+    for item in items:
+        if not first:
+            f.write(",")
+        if pretty:
+            # Nest the element's own indentation one level inside the array
+            f.write("\n  ")
+            f.write(_dumps(item, pretty=True).replace("\n", "\n  "))
+        else:
+            f.write(_dumps(item))
+        first = False
+    if pretty and not first:
+        f.write("\n")
+    f.write("]")
+
+
+def _job_title(level: JobLevel, function: JobFunction) -> str:
+    """Build the generated job title for a level and function."""
+    level_prefix = {
+        JobLevel.INDIVIDUAL_CONTRIBUTOR: "",
+        JobLevel.SENIOR_IC: "Senior ",
+        JobLevel.LEAD: "Lead ",
+        JobLevel.MANAGER: "",
+        JobLevel.SENIOR_MANAGER: "Senior ",
+        JobLevel.DIRECTOR: "",
+        JobLevel.VP: "VP of ",
+        JobLevel.C_LEVEL: "Chief ",
+    }
+
+    function_title = {
+        JobFunction.ENGINEERING: "Software Engineer" if level in [JobLevel.INDIVIDUAL_CONTRIBUTOR, JobLevel.SENIOR_IC, JobLevel.LEAD] else "Engineering Manager",
+        JobFunction.PRODUCT: "Product Manager",
+        JobFunction.DESIGN: "Designer",
+        JobFunction.SALES: "Sales Representative" if level == JobLevel.INDIVIDUAL_CONTRIBUTOR else "Sales Manager",
+        JobFunction.MARKETING: "Marketing Specialist" if level == JobLevel.INDIVIDUAL_CONTRIBUTOR else "Marketing Manager",
+        JobFunction.HR: "HR Specialist" if level == JobLevel.INDIVIDUAL_CONTRIBUTOR else "HR Manager",
+        JobFunction.EXECUTIVE: "Executive",
+    }
+
+    prefix = level_prefix.get(level, "")
+    base_title = function_title.get(function, function.value)
+
+    if level == JobLevel.VP:
+        return f"VP of {function.value}"
+    if level == JobLevel.C_LEVEL:
+        return f"Chief {function.value} Officer"
+    return f"{prefix}{base_title}"
+
+
+# Titles for every (level, function) pair, built once at import
+_TITLE_TABLE = {
+    (level, function): _job_title(level, function)
+    for level in JobLevel
+    for function in JobFunction
+}
+
+
 class SampleDataGenerator:
     """
     Generates realistic sample data for calendar analytics testing.
@@ -90,6 +208,25 @@ class SampleDataGenerator:
     TEAMS = ["Platform", "Product", "Growth", "Infrastructure", "Mobile", "Data", "Security"]
     ROLES = ["Senior Engineer", "Product Manager", "Designer", "Data Scientist", "Engineering Manager"]
 
+    # Meeting type, start hour and duration distributions for _generate_event.
+    # Cumulative weights are precomputed so random.choices skips accumulating
+    # them on every call
+    MEETING_TYPES = ["one_on_one", "team", "project", "sprint", "client", "interview", "misc"]
+    MEETING_TYPE_CUM_WEIGHTS = list(accumulate([30, 20, 20, 15, 8, 5, 2]))
+    MEETING_HOURS = list(range(8, 19))
+    MEETING_HOUR_CUM_WEIGHTS = list(accumulate(
+        [1, 5, 8, 10, 10, 6, 8, 10, 10, 8, 4]  # Peak at 10-11am and 2-4pm
+    ))
+    MEETING_DURATIONS = {
+        "one_on_one": (15, 30, 45, 60),
+        "team": (30, 60, 90),
+        "project": (30, 60),
+        "sprint": (15, 60, 90, 120),
+        "client": (30, 60),
+        "interview": (45, 60),
+        "misc": (15, 30),
+    }
+
     def __init__(self, company_domain: str = "example.com", seed: Optional[int] = None):
         """
         Initialize the generator.
@@ -99,6 +236,9 @@ class SampleDataGenerator:
             seed: Random seed for reproducibility
         """
         self.company_domain = company_domain
+        # Sequential IDs: unique per generator and stable across runs
+        self._employee_counter = count(1)
+        self._event_counter = count(1)
         if seed is not None:
             random.seed(seed)
 
@@ -208,39 +348,10 @@ class SampleDataGenerator:
         email = f"{first_name.lower()}.{last_name.lower()}@{self.company_domain}"
 
         # Generate title based on level and function
-        level_prefix = {
-            JobLevel.INDIVIDUAL_CONTRIBUTOR: "",
-            JobLevel.SENIOR_IC: "Senior ",
-            JobLevel.LEAD: "Lead ",
-            JobLevel.MANAGER: "",
-            JobLevel.SENIOR_MANAGER: "Senior ",
-            JobLevel.DIRECTOR: "",
-            JobLevel.VP: "VP of ",
-            JobLevel.C_LEVEL: "Chief ",
-        }
-
-        function_title = {
-            JobFunction.ENGINEERING: "Software Engineer" if level in [JobLevel.INDIVIDUAL_CONTRIBUTOR, JobLevel.SENIOR_IC, JobLevel.LEAD] else "Engineering Manager",
-            JobFunction.PRODUCT: "Product Manager",
-            JobFunction.DESIGN: "Designer",
-            JobFunction.SALES: "Sales Representative" if level == JobLevel.INDIVIDUAL_CONTRIBUTOR else "Sales Manager",
-            JobFunction.MARKETING: "Marketing Specialist" if level == JobLevel.INDIVIDUAL_CONTRIBUTOR else "Marketing Manager",
-            JobFunction.HR: "HR Specialist" if level == JobLevel.INDIVIDUAL_CONTRIBUTOR else "HR Manager",
-            JobFunction.EXECUTIVE: "Executive",
-        }
-
-        prefix = level_prefix.get(level, "")
-        base_title = function_title.get(function, function.value)
-
-        if level == JobLevel.VP:
-            title = f"VP of {function.value}"
-        elif level == JobLevel.C_LEVEL:
-            title = f"Chief {function.value} Officer"
-        else:
-            title = f"{prefix}{base_title}"
+        title = _TITLE_TABLE[(level, function)]
 
         return Employee(
-            employee_id=f"EMP{hash(email) % 10000:04d}",
+            employee_id=f"EMP{next(self._employee_counter):04d}",
             email=email,
             name=name,
             job_title=title,
@@ -281,16 +392,18 @@ class SampleDataGenerator:
 
         employees = list(organization.employees.values())
 
-        for day_offset in range(days):
-            current_date = start_date + timedelta(days=day_offset)
-
-            # Skip weekends
-            if current_date.weekday() >= 5:
-                continue
+        # Weekdays only; weekends get no meetings
+        workdays = [
+            current_date
+            for current_date in (start_date + timedelta(days=offset) for offset in range(days))
+            if current_date.weekday() < 5
+        ]
+        gauss = random.gauss
 
+        for current_date in workdays:
             for employee in employees:
                 # Generate events for this person on this day
-                num_events = int(random.gauss(events_per_person_per_day, 1.5))
+                num_events = int(gauss(events_per_person_per_day, 1.5))
                 num_events = max(0, min(8, num_events))
 
                 for _ in range(num_events):
@@ -298,12 +411,14 @@ class SampleDataGenerator:
                         organization,
                         employee,
                         current_date,
+                        employees,
                     )
                     if event:
                         # Add to all participants' calendars
                         for attendee_email in event.get_attendee_emails():
-                            if attendee_email in calendars:
-                                calendars[attendee_email].append(event)
+                            calendar = calendars.get(attendee_email)
+                            if calendar is not None:
+                                calendar.append(event)
 
         return calendars
 
@@ -312,37 +427,25 @@ class SampleDataGenerator:
         org: Organization,
         organizer: Employee,
         date: datetime,
+        employees: list[Employee],
     ) -> Optional[CalendarEvent]:
-        """Generate a single calendar event."""
+        """Generate a single calendar event, drawing attendees from employees."""
         # Determine meeting type
         meeting_type = random.choices(
-            ["one_on_one", "team", "project", "sprint", "client", "interview", "misc"],
-            weights=[30, 20, 20, 15, 8, 5, 2],
+            self.MEETING_TYPES, cum_weights=self.MEETING_TYPE_CUM_WEIGHTS
         )[0]
 
         # Determine time
-        hour = random.choices(
-            list(range(8, 19)),
-            weights=[1, 5, 8, 10, 10, 6, 8, 10, 10, 8, 4],  # Peak at 10-11am and 2-4pm
-        )[0]
+        hour = random.choices(self.MEETING_HOURS, cum_weights=self.MEETING_HOUR_CUM_WEIGHTS)[0]
 
         # Determine duration
-        duration_weights = {
-            "one_on_one": [15, 30, 45, 60],
-            "team": [30, 60, 90],
-            "project": [30, 60],
-            "sprint": [15, 60, 90, 120],
-            "client": [30, 60],
-            "interview": [45, 60],
-            "misc": [15, 30],
-        }
-        duration = random.choice(duration_weights.get(meeting_type, [30, 60]))
+        duration = random.choice(self.MEETING_DURATIONS.get(meeting_type, (30, 60)))
 
         start_time = date.replace(hour=hour, minute=random.choice([0, 30]), second=0, microsecond=0)
         end_time = start_time + timedelta(minutes=duration)
 
         # Generate attendees based on meeting type
-        attendees = self._generate_attendees(org, organizer, meeting_type)
+        attendees = self._generate_attendees(org, organizer, meeting_type, employees)
 
         if not attendees:
             return None
@@ -354,7 +457,7 @@ class SampleDataGenerator:
         is_recurring = meeting_type in ["one_on_one", "team", "sprint"] and random.random() < 0.7
 
         event = CalendarEvent(
-            event_id=f"evt_{hash(subject + str(start_time))}",
+            event_id=f"evt_{next(self._event_counter):010d}",
             subject=subject,
             organizer_email=organizer.email,
             start_time=start_time,
@@ -371,11 +474,16 @@ class SampleDataGenerator:
         self,
         org: Organization,
         organizer: Employee,
-        meeting_type: str
+        meeting_type: str,
+        employees: list[Employee]
     ) -> list[Attendee]:
-        """Generate appropriate attendees based on meeting type."""
+        """
+        Generate appropriate attendees based on meeting type.
+
+        ``employees`` is the organization's employee list, built once by the
+        caller rather than for every event.
+        """
         attendees = []
-        employees = list(org.employees.values())
 
         if meeting_type == "one_on_one":
             # 1:1 with direct report, manager, or peer
@@ -387,31 +495,23 @@ class SampleDataGenerator:
                 if manager:
                     candidates.append(manager)
             # Add peers
-            candidates.extend([
-                e for e in employees
-                if e.team == organizer.team and e.email != organizer.email
-            ][:5])
+            candidates.extend(org.get_team_members(organizer)[:5])
 
             if candidates:
                 attendee_emp = random.choice(candidates)
-                attendees.append(Attendee(
-                    email=attendee_emp.email,
-                    name=attendee_emp.name,
-                    response=random.choice([AttendeeResponse.ACCEPTED, AttendeeResponse.ACCEPTED, AttendeeResponse.TENTATIVE]),
+                attendees.append(self._internal_attendee(
+                    attendee_emp,
+                    random.choice([AttendeeResponse.ACCEPTED, AttendeeResponse.ACCEPTED, AttendeeResponse.TENTATIVE]),
                 ))
 
         elif meeting_type == "team":
             # Team meeting with 3-8 people from same team/function
-            team_members = [
-                e for e in employees
-                if e.team == organizer.team and e.email != organizer.email
-            ]
+            team_members = org.get_team_members(organizer)
             num_attendees = min(len(team_members), random.randint(3, 8))
             for emp in random.sample(team_members, num_attendees) if team_members else []:
-                attendees.append(Attendee(
-                    email=emp.email,
-                    name=emp.name,
-                    response=random.choice([AttendeeResponse.ACCEPTED, AttendeeResponse.ACCEPTED, AttendeeResponse.NO_RESPONSE]),
+                attendees.append(self._internal_attendee(
+                    emp,
+                    random.choice([AttendeeResponse.ACCEPTED, AttendeeResponse.ACCEPTED, AttendeeResponse.NO_RESPONSE]),
                 ))
 
         elif meeting_type in ["project", "sprint"]:
@@ -420,10 +520,9 @@ class SampleDataGenerator:
             sampled = random.sample(employees, min(len(employees), num_attendees + 5))
             for emp in sampled[:num_attendees]:
                 if emp.email != organizer.email:
-                    attendees.append(Attendee(
-                        email=emp.email,
-                        name=emp.name,
-                        response=random.choice([AttendeeResponse.ACCEPTED, AttendeeResponse.TENTATIVE, AttendeeResponse.NO_RESPONSE]),
+                    attendees.append(self._internal_attendee(
+                        emp,
+                        random.choice([AttendeeResponse.ACCEPTED, AttendeeResponse.TENTATIVE, AttendeeResponse.NO_RESPONSE]),
                     ))
 
         elif meeting_type == "client":
@@ -438,11 +537,7 @@ class SampleDataGenerator:
             # Add 1-2 internal people
             for emp in random.sample(employees, min(2, len(employees))):
                 if emp.email != organizer.email:
-                    attendees.append(Attendee(
-                        email=emp.email,
-                        name=emp.name,
-                        response=AttendeeResponse.ACCEPTED,
-                    ))
+                    attendees.append(self._internal_attendee(emp, AttendeeResponse.ACCEPTED))
 
         elif meeting_type == "interview":
             # Interview panel
@@ -458,14 +553,19 @@ class SampleDataGenerator:
             num = random.randint(1, 4)
             for emp in random.sample(employees, min(num, len(employees))):
                 if emp.email != organizer.email:
-                    attendees.append(Attendee(
-                        email=emp.email,
-                        name=emp.name,
-                        response=AttendeeResponse.ACCEPTED,
-                    ))
+                    attendees.append(self._internal_attendee(emp, AttendeeResponse.ACCEPTED))
 
         return attendees
 
+    def _internal_attendee(self, employee: Employee, response: AttendeeResponse) -> Attendee:
+        """
+        Build an Attendee for an employee with a given response.
+
+        Each event gets its own Attendee, since attendees are mutable
+        (loaders and callers update names, responses and flags per event).
+        """
+        return Attendee(email=employee.email, name=employee.name, response=response)
+
     def _generate_subject(
         self,
         meeting_type: str,
@@ -493,7 +593,9 @@ class SampleDataGenerator:
         self,
         organization: Organization,
         calendars: dict[str, list[CalendarEvent]],
-        output_dir: str
+        output_dir: str,
+        pretty: bool = True,
+        shared_events: bool = False
     ) -> None:
         """
         Export sample data to JSON files.
@@ -502,6 +604,12 @@ class SampleDataGenerator:
             organization: Organization data
             calendars: Calendar events by employee
             output_dir: Directory to write files
+            pretty: Whether to indent the JSON for reading (the default);
+                pass False for compact files
+            shared_events: Write each event once to events.jsonl and make
+                the per-person calendar files lists of event IDs, instead
+                of repeating every event in each attendee's file. Load
+                this layout with OutlookCalendarLoader.load_shared_calendars
         """
         import os
 
@@ -531,42 +639,46 @@ class SampleDataGenerator:
             ]
         }
 
-        with open(f"{output_dir}/hris_data.json", "w") as f:
-            json.dump(hris_data, f, indent=2)
+        with open(f"{output_dir}/hris_data.json", "w", encoding="utf-8") as f:
+            f.write(_dumps(hris_data, pretty))
 
         # Export calendar data (one file per person)
         calendar_dir = f"{output_dir}/calendars"
         os.makedirs(calendar_dir, exist_ok=True)
 
-        for email, events in calendars.items():
-            safe_email = email.replace("@", "_at_").replace(".", "_")
-            calendar_data = [
-                {
-                    "event_id": e.event_id,
-                    "subject": e.subject,
-                    "organizer_email": e.organizer_email,
-                    "start_time": e.start_time.isoformat(),
-                    "end_time": e.end_time.isoformat(),
-                    "attendees": [
-                        {
-                            "email": a.email,
-                            "name": a.name,
-                            "response": a.response.value,
-                            "is_required": a.is_required,
-                            "is_external": a.is_external,
-                        }
-                        for a in e.attendees
-                    ],
-                    "is_recurring": e.is_recurring,
-                    "recurrence_pattern": e.recurrence_pattern,
-                    "importance": e.importance,
-                }
-                for e in events
-            ]
+        if shared_events:
+            events_by_id: dict[str, CalendarEvent] = {}
+            for events in calendars.values():
+                for event in events:
+                    events_by_id.setdefault(event.event_id, event)
 
-            with open(f"{calendar_dir}/{safe_email}.json", "w") as f:
-                json.dump(calendar_data, f, indent=2)
+            with open(f"{output_dir}/events.jsonl", "w", encoding="utf-8") as f:
+                for event in events_by_id.values():
+                    f.write(_dumps(_event_to_dict(event)))
+                    f.write("\n")
+
+            for email, events in calendars.items():
+                with open(f"{calendar_dir}/{_calendar_filename(email)}", "w", encoding="utf-8") as f:
+                    f.write(_dumps([event.event_id for event in events], pretty))
+
+        else:
+            for email, events in calendars.items():
+                _write_calendar(calendar_dir, email, events, pretty)
 
         print(f"Exported data to {output_dir}/")
         print(f"  - HRIS data: hris_data.json ({len(organization.employees)} employees)")
+        if shared_events:
+            print(f"  - Events: events.jsonl ({len(events_by_id)} events)")
         print(f"  - Calendars: {len(calendars)} files in calendars/")
+
+
+def _write_calendar(
+    calendar_dir: str,
+    email: str,
+    events: list[CalendarEvent],
+    pretty: bool
+) -> None:
+    """Write one employee's calendar file."""
+    # Events are converted and written one at a time
+    with open(f"{calendar_dir}/{_calendar_filename(email)}", "w", encoding="utf-8") as f:
+        _write_json_array(f, map(_event_to_dict, events), pretty)
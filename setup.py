@@ -39,6 +39,9 @@ setup(
             "mypy>=1.0.0",
             "ruff>=0.1.0",
         ],
+        "fast": [
+            "orjson>=3.8.0",
+        ],
         "viz": [
             "matplotlib>=3.7.0",
             "pandas>=2.0.0",
@@ -1,18 +1,24 @@
 """Tests for analytics modules."""
 
+import json
+
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from calendar_analytics.models.calendar_event import CalendarEvent, Attendee
 from calendar_analytics.models.employee import Employee, Organization, JobLevel, JobFunction
 from calendar_analytics.analytics.meeting_analyzer import MeetingAnalyzer
+from calendar_analytics.data_loaders.data_processor import DataProcessor
+from calendar_analytics.data_loaders.hris_loader import HRISLoader
+from calendar_analytics.data_loaders.outlook_loader import OutlookCalendarLoader
+from calendar_analytics.utils.report_generator import ReportGenerator
 from calendar_analytics.utils.sample_data_generator import SampleDataGenerator
 
 
 class TestMeetingAnalyzer:
     """Tests for MeetingAnalyzer."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_events(self):
         """Create sample events for testing."""
         events = []
@@ -88,6 +94,224 @@ class TestMeetingAnalyzer:
         assert result["all_hands"]["count"] == 1
 
 
+class TestDataProcessor:
+    """Tests for DataProcessor."""
+
+    def test_results_follow_list_mutation(self):
+        """Test that results reflect in-place changes to the event list."""
+        processor = DataProcessor(Organization(company_name="Test Corp", domain="test.com"))
+        base_date = datetime(2024, 1, 15, 9)
+        events = [
+            CalendarEvent(
+                event_id=f"e{i}",
+                subject="Sync",
+                organizer_email="a@test.com",
+                start_time=base_date,
+                end_time=base_date + timedelta(minutes=30),
+                is_recurring=(i == 0),
+            )
+            for i in range(2)
+        ]
+
+        assert [e.event_id for e in processor.get_recurring_events(events)] == ["e0"]
+        events.reverse()
+        assert [e.event_id for e in processor.get_recurring_events(events)] == ["e0"]
+        assert [e.event_id for e in processor.get_adhoc_events(events)] == ["e1"]
+
+        assert processor.filter_events_by_employee(events, "a@test.com", as_organizer=True, as_attendee=False)
+        events[0] = events[1] = CalendarEvent(
+            event_id="e2",
+            subject="Sync",
+            organizer_email="b@test.com",
+            start_time=base_date,
+            end_time=base_date + timedelta(minutes=30),
+        )
+        assert processor.filter_events_by_employee(events, "a@test.com", as_organizer=True, as_attendee=False) == []
+        assert list(processor.group_events_by_organizer(events)) == ["b@test.com"]
+
+
+    def test_groups_keep_first_appearance_order(self):
+        """Test that grouped dicts are ordered by first appearance."""
+        processor = DataProcessor(Organization(company_name="Test Corp", domain="test.com"))
+        events = [
+            CalendarEvent(
+                event_id=f"e{i}",
+                subject="Sync",
+                organizer_email=organizer,
+                start_time=datetime(2024, 1, day, 9),
+                end_time=datetime(2024, 1, day, 10),
+            )
+            for i, (organizer, day) in enumerate([("z@test.com", 17), ("a@test.com", 15), ("z@test.com", 16)])
+        ]
+
+        assert list(processor.group_events_by_organizer(events)) == ["z@test.com", "a@test.com"]
+        assert [[e.event_id for e in evs] for evs in processor.group_events_by_week(events).values()] == [
+            ["e0", "e1", "e2"],
+        ]
+        assert list(processor.calculate_meeting_load_by_day(events)) == ["Wednesday", "Monday", "Tuesday"]
+
+    def test_grouping_uses_each_event_time_zone(self):
+        """Test that equal instants in different zones group by local date."""
+        processor = DataProcessor(Organization(company_name="Test Corp", domain="test.com"))
+        utc_start = datetime(2024, 1, 1, 2, tzinfo=timezone.utc)
+        events = [
+            CalendarEvent(
+                event_id=f"e{i}",
+                subject="Sync",
+                organizer_email="a@test.com",
+                start_time=start,
+                end_time=start + timedelta(minutes=30),
+            )
+            for i, start in enumerate((utc_start, utc_start.astimezone(timezone(timedelta(hours=-5)))))
+        ]
+
+        by_day = processor.group_events_by_day_of_week(events)
+        assert {day: [e.event_id for e in evs] for day, evs in by_day.items()} == {
+            "Monday": ["e0"],
+            "Sunday": ["e1"],
+        }
+
+
+class TestHRISLoader:
+    """Tests for HRISLoader."""
+
+    def test_partial_match_uses_first_listed_keyword(self):
+        """Test that level/function inference keeps map order as priority."""
+        loader = HRISLoader()
+
+        # "senior" is listed before "manager" and "senior manager"
+        assert loader._parse_job_level("", "Senior Manager, Sales") == JobLevel.SENIOR_IC
+        assert loader._parse_job_level("Senior Manager", "") == JobLevel.SENIOR_MANAGER
+        assert loader._parse_job_level("", "Head of Widgets") == JobLevel.UNKNOWN
+        assert loader._parse_job_function("", "Senior Data Analyst") == JobFunction.DATA_SCIENCE
+        assert loader._parse_job_function("Growth Marketing", "") == JobFunction.MARKETING
+
+    def test_record_ids_and_names(self):
+        """Test employee id and name defaults for dict, JSON and CSV records."""
+        loader = HRISLoader(company_domain="test.com")
+
+        employee = loader.load_from_dict({"id": "E1", "email": "Jane.Doe@test.com"})
+        assert employee.employee_id == "Jane.Doe@test.com"
+        assert employee.name == ""
+
+        employee = loader._parse_json_employee({"id": "E1", "email": "jane.doe@test.com"})
+        assert employee.employee_id == "E1"
+        assert employee.name == ""
+
+        employee = loader._parse_csv_fields({"employee_id": "E1", "email": "jane.doe@test.com"})
+        assert employee.name == "Jane Doe"
+
+    def test_overridden_maps_are_used(self):
+        """Test that subclass and instance keyword map overrides apply."""
+        class WidgetLoader(HRISLoader):
+            JOB_LEVEL_MAP = {**HRISLoader.JOB_LEVEL_MAP, "head": JobLevel.DIRECTOR}
+
+        loader = WidgetLoader()
+        assert loader._parse_job_level("", "Head of Widgets") == JobLevel.DIRECTOR
+        assert loader._parse_job_level("VP", "") == JobLevel.VP
+
+        # The shared defaults cannot be changed in place
+        with pytest.raises(TypeError):
+            HRISLoader.JOB_LEVEL_MAP["head"] = JobLevel.DIRECTOR
+
+        loader.JOB_FUNCTION_MAP = {"widgets": JobFunction.PRODUCT}
+        assert loader._parse_job_function("", "Head of Widgets") == JobFunction.PRODUCT
+        assert HRISLoader()._parse_job_function("", "Head of Widgets") == JobFunction.OTHER
+
+
+class TestOutlookCalendarLoader:
+    """Tests for OutlookCalendarLoader."""
+
+    def test_load_csv_max_rows(self, tmp_path):
+        """Test that load_csv stops after max_rows events."""
+        path = tmp_path / "calendar.csv"
+        lines = ["Subject,Start Date,Start Time,End Date,End Time,Organizer"]
+        lines += [
+            f"Meeting {i},2024-01-15,{9 + i}:00,2024-01-15,{9 + i}:30,Organizer@Example.com"
+            for i in range(5)
+        ]
+        path.write_text("\n".join(lines) + "\n")
+
+        loader = OutlookCalendarLoader(company_domain="example.com")
+        events = loader.load_csv(path, max_rows=2)
+
+        assert [e.subject for e in events] == ["Meeting 0", "Meeting 1"]
+        assert events[0].organizer_email == "organizer@example.com"
+        assert len(loader.load_csv(path)) == 5
+
+
+class TestMeetingTextAnalyzer:
+    """Tests for MeetingTextAnalyzer."""
+
+    def test_category_ties_keep_first_appearance(self):
+        """Test that categories with equal counts are ordered by first appearance."""
+        from calendar_analytics.analytics.text_analyzer import MeetingTextAnalyzer
+
+        base_date = datetime(2024, 1, 15)
+        events = [
+            CalendarEvent(
+                event_id=str(i),
+                subject=subject,
+                organizer_email="manager@example.com",
+                start_time=base_date.replace(hour=9 + i),
+                end_time=base_date.replace(hour=10 + i),
+            )
+            for i, subject in enumerate(["Q3 Roadmap", "Daily standup"])
+        ]
+
+        categories = MeetingTextAnalyzer().analyze_meeting_categories(events)["categories"]
+        assert list(categories) == ["planning", "status_update"]
+
+
+class TestReportGenerator:
+    """Tests for ReportGenerator."""
+
+    def test_reports_with_missing_metrics(self):
+        """Test that missing summary metrics render as N/A."""
+        reporter = ReportGenerator()
+
+        summary = reporter.generate_executive_summary({})
+        assert "Total Hours:                    N/A" in summary
+
+        markdown = reporter.generate_markdown_report({"summary": {"total_hours": 12.345}})
+        assert "| Total Hours | 12.3 |" in markdown
+        assert "| Avg Hours/Day | N/A |" in markdown
+
+    def test_markdown_report_streamed(self):
+        """Test that the streamed markdown report is the returned one plus a newline."""
+        from io import StringIO
+
+        reporter = ReportGenerator()
+        insights = {"summary": {"total_meetings": 3, "total_hours": 2.5}}
+        markdown = reporter.generate_markdown_report(insights)
+
+        out = StringIO()
+        assert reporter.generate_markdown_report(insights, out=out) is None
+        assert out.getvalue() == markdown + "\n"
+
+    def test_orjson_json_differences(self):
+        """Pin the accepted differences between the orjson and json outputs."""
+        pytest.importorskip("orjson")
+        from calendar_analytics.models.calendar_event import MeetingCategory
+        from calendar_analytics.utils.report_generator import _orjson_dumps
+
+        insights = {
+            "name": "José",
+            "ratio": float("nan"),
+            "category": MeetingCategory.PLANNING,
+            "generated_at": datetime(2024, 1, 15, 9),
+        }
+
+        assert _orjson_dumps(insights, pretty=False).decode("utf-8") == (
+            '{"name":"José","ratio":null,"category":"planning",'
+            '"generated_at":"2024-01-15 09:00:00"}'
+        )
+        assert ReportGenerator().generate_json_report(insights, pretty=False) == (
+            '{"name":"José","ratio":null,"category":"planning",'
+            '"generated_at":"2024-01-15 09:00:00"}'
+        )
+
+
 class TestSampleDataGenerator:
     """Tests for sample data generator."""
 
@@ -113,6 +337,69 @@ class TestSampleDataGenerator:
         total_events = sum(len(events) for events in calendars.values())
         assert total_events > 0
 
+        # Events do not share mutable Attendee objects
+        events = {e.event_id: e for evs in calendars.values() for e in evs}.values()
+        attendees = [a for e in events for a in e.attendees]
+        assert len({id(a) for a in attendees}) == len(attendees)
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_json_output_without_orjson(self, monkeypatch, pretty):
+        """Test that export JSON is the same with and without orjson."""
+        from calendar_analytics.utils import sample_data_generator
+
+        data = {"name": "José Müller", "reports": ["a@test.com"], "manager": None}
+        with_orjson = sample_data_generator._dumps(data, pretty)
+        monkeypatch.setattr(sample_data_generator, "orjson", None)
+
+        assert with_orjson == sample_data_generator._dumps(data, pretty)
+        assert with_orjson.isascii()
+
+    def test_shared_events_export(self, tmp_path):
+        """Test that a shared-events export loads back into the same calendars."""
+        generator = SampleDataGenerator(company_domain="test.com", seed=42)
+        org = generator.generate_organization(employee_count=10)
+        calendars = generator.generate_calendar_events(org, days=3)
+        generator.export_sample_data(org, calendars, str(tmp_path), shared_events=True)
+
+        loader = OutlookCalendarLoader(company_domain="test.com")
+        loaded = loader.load_shared_calendars(
+            tmp_path / "events.jsonl",
+            {email: tmp_path / "calendars" / (email.replace("@", "_at_").replace(".", "_") + ".json")
+             for email in calendars},
+        )
+
+        for email, events in calendars.items():
+            assert [e.event_id for e in loaded[email]] == [e.event_id for e in events]
+            assert [e.subject for e in loaded[email]] == [e.subject for e in events]
+
+    def test_shared_events_analyze(self, tmp_path):
+        """Test that analyze reads a shared-events export back into all events."""
+        import argparse
+        from calendar_analytics.analytics.insights_engine import InsightsEngine
+        from calendar_analytics.cli import run_analyze
+
+        generator = SampleDataGenerator(company_domain="test.com", seed=42)
+        org = generator.generate_organization(employee_count=10)
+        calendars = generator.generate_calendar_events(org, days=3)
+        generator.export_sample_data(org, calendars, str(tmp_path), shared_events=True)
+
+        args = argparse.Namespace(
+            hris=str(tmp_path / "hris_data.json"), calendars=str(tmp_path / "calendars"),
+            domain=None, output=str(tmp_path / "report.json"), format="json",
+        )
+        run_analyze(args)
+        report = json.loads((tmp_path / "report.json").read_text())
+
+        events = list({e.event_id: e for evs in calendars.values() for e in evs}.values())
+        expected = InsightsEngine(org).generate_full_insights(events)["summary"]
+        assert report["summary"]["total_meetings"] == len(events)
+        assert report["summary"] == json.loads(json.dumps(expected))
+
+        # Without events.jsonl the ID lists are rejected rather than read as empty
+        (tmp_path / "events.jsonl").unlink()
+        with pytest.raises(ValueError, match="event IDs"):
+            run_analyze(args)
+
     def test_reproducibility(self):
         """Test that seeded generation is reproducible."""
         gen1 = SampleDataGenerator(seed=123)